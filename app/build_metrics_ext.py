@@ -0,0 +1,51 @@
+"""
+METRİK ÇEKİRDEĞİ AOT DERLEYİCİSİ
+================================
+MetricsService'in Numba çekirdeklerini numba.pycc ile önceden derleyip
+src/services/metrics_ext (.so / .pyd) eklentisini üretir. Eklenti
+mevcutsa MetricsService onu kullanır ve ilk çağrıda JIT derleme
+beklenmez; yoksa JIT'e, Numba da yoksa NumPy yoluna düşülür.
+
+Kullanım (numba yalnızca derleme anında gerekir):
+    python build_metrics_ext.py
+
+Not: Üretilen dosya platforma ve Python sürümüne özeldir, depoya
+eklenmez; dağıtım ortamında bir kez çalıştırılmalıdır.
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+from src.services.metrics_service import (
+    AOT_ABI_VERSION,
+    AOT_BATCH_SIGNATURE,
+    AOT_PATH_SIGNATURE,
+    _batch_costs_kernel,
+    _path_metrics_kernel,
+)
+
+
+def _abi_version():
+    """Eklentinin hangi çekirdek sürümüyle derlendiğini bildirir."""
+    return AOT_ABI_VERSION
+
+
+def main() -> None:
+    output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'services')
+
+    cc = CC('metrics_ext')
+    cc.output_dir = output_dir
+
+    cc.export('abi_version', 'i8()')(_abi_version)
+    cc.export('path_metrics', AOT_PATH_SIGNATURE)(_path_metrics_kernel)
+    # prange AOT'de seri döngü olarak derlenir; paralel sürüm JIT'te kalır
+    cc.export('batch_costs', AOT_BATCH_SIGNATURE)(_batch_costs_kernel)
+
+    cc.compile()
+    print(f"[OK] metrics_ext derlendi: {output_dir}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,16 @@
+"""
+Algoritmalar için Python sürüm uyumluluk yardımcıları.
+"""
+
+try:
+    from itertools import pairwise
+except ImportError:  # Python 3.9: itertools.pairwise 3.10+
+    from itertools import tee
+
+    def pairwise(iterable):
+        """(a, b), (b, c), ... çiftleri; dilim kopyası oluşturmaz."""
+        first, second = tee(iterable)
+        next(second, None)
+        return zip(first, second)
+
+__all__ = ["pairwise"]
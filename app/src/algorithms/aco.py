@@ -184,7 +184,6 @@ class OptimizedACO:
             
             # =============== Tüm karıncaları çalıştır (paralel yol inşası) ===============
             paths = []   # Bu iterasyonda bulunan tüm yollar
-            fits = []    # Yolların fitness değerleri
             
             for _ in range(self.n_ants):
                 # Her karınca bağımsız bir yol inşa eder
@@ -192,15 +191,15 @@ class OptimizedACO:
                 
                 if path:  # Geçerli yol bulunduysa
                     paths.append(path)
-                    # Yolun maliyetini hesapla
-                    fitness = self.metrics.calculate_weighted_cost(
-                        path,
-                        weights['delay'],
-                        weights['reliability'],
-                        weights['resource'],
-                        bandwidth_demand
-                    )
-                    fits.append(fitness)
+            
+            # Yolların fitness değerleri: tüm koloni tek toplu çağrıda
+            fits = self.metrics.calculate_weighted_cost_batch(
+                paths,
+                weights['delay'],
+                weights['reliability'],
+                weights['resource'],
+                bandwidth_demand
+            ).tolist()
             
             # =============== Global en iyi çözümü güncelle ===============
             if fits:  # En az bir geçerli yol bulunduysa
@@ -309,10 +308,11 @@ class OptimizedACO:
             # ------------------------------------------------------------------
             # Geçerli komşuları filtrele
             # ------------------------------------------------------------------
+            cur_adj = self.graph._adj[cur]  # Komşu -> kenar verisi (görünüm nesnesi kurulmaz)
             candidates = [
-                n for n in self.graph.neighbors(cur)
+                n for n in cur_adj
                 if n not in visited  # Daha önce ziyaret edilmemiş
-                and (bw <= 0 or self.graph[cur][n].get('bandwidth', 1000) >= bw)  # Bandwidth yeterli
+                and (bw <= 0 or cur_adj[n].get('bandwidth', 1000) >= bw)  # Bandwidth yeterli
             ]
             
             if not candidates:
@@ -386,7 +386,13 @@ class OptimizedACO:
         Returns:
             Sezgisel değer (0.001 ile 1 arası)
         """
-        edge = self.graph.edges[u, v]
+        # İç dict'lere doğrudan erişim (EdgeView/NodeView nesnesi kurulmaz)
+        edge = self.graph._adj[u][v]
+
+        # GraphService 1000 / max(bw, 1) değerini yüklemede hesaplar; yoksa burada
+        rc = edge.get('resource_cost')
+        if rc is None:
+            rc = 1000 / max(edge['bandwidth'], 1)
         
         # Ağırlıklı toplam maliyet hesapla
         cost = (
@@ -396,11 +402,11 @@ class OptimizedACO:
             # Güvenilirlik maliyeti (log-olasılık: yüksek güvenilirlik = düşük maliyet)
             w['reliability'] * (
                 -math.log(max(edge['reliability'], 0.01)) -
-                math.log(max(self.graph.nodes[v].get('reliability', 0.99), 0.01))
+                math.log(max(self.graph._node[v].get('reliability', 0.99), 0.01))
             ) +
             
             # Kaynak maliyeti (düşük bandwidth = yüksek maliyet)
-            w['resource'] * (1000 / max(edge['bandwidth'], 1)) / 100
+            w['resource'] * rc / 100
         )
         
         # η = 1 / (1 + maliyet), minimum 0.001
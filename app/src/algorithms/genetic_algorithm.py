@@ -34,9 +34,12 @@ import random, time, logging, threading, atexit, os, math
 from typing import List, Dict, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 from functools import lru_cache, partial
+from itertools import islice
 import networkx as nx
 import multiprocessing
 
+from ._compat import pairwise
+
 # Servis importları (modül bağımsız çalışabilir)
 try:
     from ..services.metrics_service import MetricsService
@@ -122,27 +125,39 @@ def _fitness_worker(path_list: List[int], graph: nx.Graph,
         
         source, destination = path_list[0], path_list[-1]
         
+        # NetworkX görünüm nesneleri yerine iç dict'ler (her erişimde view kurulmaz)
+        nodes, adj = graph._node, graph._adj
+        # Eksik öznitelik varsayılanları MetricsService._build_arrays ile aynı
+        
         # ADIM 1: Düğüm metrikleri
         for node in path_list:
+            node_data = nodes[node]
             # Processing delay: Sadece ara düğümler (proje yönergesi)
             if node != source and node != destination:
-                total_delay += float(graph.nodes[node].get('processing_delay', 0.0))
+                total_delay += node_data.get('processing_delay', 0.0)
             
             # Node reliability: Tüm düğümler dahil
-            nr = float(graph.nodes[node].get('reliability', 0.99))
-            reliability_cost += -math.log(max(nr, 0.001))  # Sıfır bölme koruması
+            # GraphService -log değerini yüklemede hesaplar; yoksa burada
+            nlr = node_data.get('neglog_reliability')
+            if nlr is None:
+                nlr = -math.log(max(node_data.get('reliability', 1.0), 0.001))  # Sıfır bölme koruması
+            reliability_cost += nlr
         
         # ADIM 2: Kenar metrikleri
         for i in range(len(path_list) - 1):
             u, v = path_list[i], path_list[i+1]
-            edge = graph[u][v]
+            edge = adj[u][v]
             
-            total_delay += edge.get('delay', 1.0)
-            reliability_cost += -math.log(max(float(edge.get('reliability', 0.99)), 0.001))
+            total_delay += edge.get('delay', 0.0)
+            nlr = edge.get('neglog_reliability')
+            if nlr is None:
+                nlr = -math.log(max(edge.get('reliability', 1.0), 0.001))
+            reliability_cost += nlr
             
-            bw = float(edge.get('bandwidth', 1000.0))
+            bw = edge.get('bandwidth', 1000.0)
             min_bw = min(min_bw, bw)  # Darboğaz tespiti
-            raw_resource_cost += (1000.0 / max(bw, 1.0))  # 1Gbps / BW formülü
+            rc = edge.get('resource_cost')
+            raw_resource_cost += rc if rc is not None else (1000.0 / max(bw, 1.0))  # 1Gbps / BW formülü
 
         # ADIM 3: Bandwidth kısıt kontrolü (sert kısıt)
         if bw_demand > 0 and min_bw < bw_demand:
@@ -463,20 +478,12 @@ class GeneticAlgorithm:
         """
         # Experiment mode: MetricsService
         if self.use_standard_metrics and self.metrics_service:
-            results = []
-            for path in population:
-                if bw_demand > 0:  # Bandwidth kontrolü
-                    min_bw = min(self.graph[path[i]][path[i+1]].get('bandwidth', 1000.0) 
-                               for i in range(len(path)-1) if self.graph.has_edge(path[i], path[i+1]))
-                    if min_bw < bw_demand:
-                        results.append((path, float('inf')))
-                        continue
-                fit = self.metrics_service.calculate_weighted_cost(
-                    path, self.current_weights['delay'], 
-                    self.current_weights['reliability'], 
-                    self.current_weights['resource'])
-                results.append((path, fit))
-            return results
+            # Tüm popülasyon tek toplu çağrıda (bandwidth kontrolü dahil)
+            costs = self.metrics_service.calculate_weighted_cost_batch(
+                population, self.current_weights['delay'],
+                self.current_weights['reliability'],
+                self.current_weights['resource'], bw_demand)
+            return list(zip(population, costs.tolist()))
         
         # Normal mode: Normalize fitness
         should_parallel = pool and self.use_parallel and len(population) > GAConfig.PARALLEL_MIN_POPULATION
@@ -558,16 +565,23 @@ class GeneticAlgorithm:
         
         # 3. Fitness-based guided initialization
         if self.current_weights:
-            candidates = []
+            candidate_paths = []
             for _ in range(min(50, self.population_size * 2)):
                 path = (self._generate_guided_path(source, destination, bandwidth_demand) 
                        if random.random() < self.guided_ratio 
                        else self._generate_random_path(source, destination, bandwidth_demand))
                 if path and tuple(path) not in seen_paths:
-                    fit = (self.metrics_service.calculate_weighted_cost(path, **self.current_weights, bandwidth_demand=bandwidth_demand)
-                          if (self.use_standard_metrics and self.metrics_service)
-                          else _fitness_worker(path, self.graph, self.current_weights, bandwidth_demand))
-                    candidates.append((fit, path))
+                    candidate_paths.append(path)
+            
+            if self.use_standard_metrics and self.metrics_service:
+                fits = self.metrics_service.calculate_weighted_cost_batch(
+                    candidate_paths, self.current_weights['delay'],
+                    self.current_weights['reliability'],
+                    self.current_weights['resource'], bandwidth_demand).tolist()
+            else:
+                fits = [_fitness_worker(path, self.graph, self.current_weights, bandwidth_demand)
+                        for path in candidate_paths]
+            candidates = list(zip(fits, candidate_paths))
             
             # En iyi %50'si
             candidates.sort(key=lambda x: x[0])
@@ -610,9 +624,10 @@ class GeneticAlgorithm:
                 return path
             
             # Bandwidth filtreli komşular
+            current_adj = self.graph._adj[current]
             neighbors = [n for n in self._neighbor_cache[current] 
                         if n not in visited and 
-                        (bandwidth_demand == 0 or self.graph[current][n].get('bandwidth', 0) >= bandwidth_demand)]
+                        (bandwidth_demand == 0 or current_adj[n].get('bandwidth', 0) >= bandwidth_demand)]
             
             if not neighbors:
                 return None
@@ -771,16 +786,16 @@ class GeneticAlgorithm:
                 repaired.append(clean[i])
             else:
                 sp = self._cached_shortest_path(repaired[-1], clean[i])
-                if sp: repaired.extend(list(sp)[1:])
+                if sp: repaired.extend(islice(sp, 1, None))  # Ara liste/dilim kopyası yok
         if repaired[-1] != dst:
             sp = self._cached_shortest_path(repaired[-1], dst)
-            if sp: repaired.extend(list(sp)[1:])
+            if sp: repaired.extend(islice(sp, 1, None))
         return repaired if repaired[-1] == dst else []
 
     def _is_valid(self, path):
         """Yol geçerlilik kontrolü"""
         return (path and len(path) >= 2 and len(path) == len(set(path)) and
-               all(self.graph.has_edge(path[i], path[i+1]) for i in range(len(path)-1)))
+               all(self.graph.has_edge(u, v) for u, v in pairwise(path)))
 
     def _calculate_diversity(self, population):
         """Popülasyon çeşitliliği (Jaccard Distance)"""
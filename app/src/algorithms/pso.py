@@ -20,9 +20,10 @@ import random
 import time
 import os
 import networkx as nx
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass
 
+from src.algorithms._compat import pairwise
 from src.services.metrics_service import MetricsService
 from src.core.config import settings
 
@@ -193,7 +194,12 @@ class ParticleSwarmOptimization:
         self.gbest_history.clear()
         self.avg_fitness_history.clear()
 
-        particles = self._initialize_particles(source, destination, weights, bandwidth_demand)
+        # Ağırlıklar koşu boyunca sabit: maliyet fonksiyonu bir kez kurulur
+        cost_fn = self.metrics_service.make_cost_fn(
+            weights["delay"], weights["reliability"], weights["resource"], bandwidth_demand
+        )
+
+        particles = self._initialize_particles(source, destination, weights, bandwidth_demand, cost_fn)
 
         # fallback
         if not particles:
@@ -208,7 +214,7 @@ class ParticleSwarmOptimization:
                     fallback = nx.shortest_path(temp_graph, source, destination)
                 else:
                     fallback = nx.shortest_path(self.graph, source, destination)
-                f = self._calculate_fitness(fallback, weights, bandwidth_demand)
+                f = self._calculate_fitness(fallback, cost_fn)
             except Exception:
                 fallback = [source, destination]
                 f = float("inf")
@@ -233,8 +239,8 @@ class ParticleSwarmOptimization:
 
                 if new_path:
                     new_path = self._trim_path(new_path)
-                    # Pass bandwidth_demand to fitness
-                    new_fitness = self._calculate_fitness(new_path, weights, bandwidth_demand)
+                    # cost_fn bandwidth_demand'i zaten içerir
+                    new_fitness = self._calculate_fitness(new_path, cost_fn)
 
                     particle.path = new_path
                     particle.fitness = new_fitness
@@ -271,19 +277,29 @@ class ParticleSwarmOptimization:
     # 5) INITIALIZATION
     # =========================
     # Amaç: her particle için geçerli bir başlangıç yolu üretmek (random walk)
-    def _initialize_particles(self, source: int, destination: int, weights: Dict[str, float], bw_demand: float = 0.0) -> List[Particle]:
-        particles: List[Particle] = []
+    def _initialize_particles(self, source: int, destination: int, weights: Dict[str, float], bw_demand: float,
+                              cost_fn: Callable[[List[int]], float]) -> List[Particle]:
+        paths: List[List[int]] = []
         attempts = self.n_particles * 4  # zor graph için daha çok deneme
 
-        while len(particles) < self.n_particles and attempts > 0:
+        while len(paths) < self.n_particles and attempts > 0:
             attempts -= 1
             # Pass bw_demand to generator
             path = self._generate_random_path(source, destination, max_length=self.max_path_len, bw_demand=bw_demand)
             if path:
-                fit = self._calculate_fitness(path, weights, bw_demand)
-                particles.append(Particle(path, fit))
+                paths.append(path)
+
+        # Başlangıç sürüsü tek toplu çağrıyla değerlendirilir
+        try:
+            fits = self.metrics_service.calculate_weighted_cost_batch(
+                paths, weights["delay"], weights["reliability"], weights["resource"], bw_demand
+            ).tolist()
+        except (LookupError, ValueError):
+            # Graf dışı düğüm / etiket içeren yol: yol yol değerlendir
+            # (hatalı yol inf alır, diğerleri etkilenmez)
+            fits = [self._calculate_fitness(path, cost_fn) for path in paths]
 
-        return particles
+        return [Particle(path, fit) for path, fit in zip(paths, fits)]
 
     # Random walk:
     # - unvisited komşuları tercih eder (loop azalsın)
@@ -457,21 +473,16 @@ class ParticleSwarmOptimization:
             return False
         if len(path) != len(set(path)):
             return False
-        for u, v in zip(path[:-1], path[1:]):
+        for u, v in pairwise(path):
             if not self.graph.has_edge(u, v):
                 return False
         return True
 
     # fitness = MetricsService ağırlıklı maliyeti (küçük daha iyi)
-    def _calculate_fitness(self, path: List[int], weights: Dict[str, float], bandwidth_demand: float = 0.0) -> float:
+    # cost_fn: optimize() içinde make_cost_fn ile kurulan koşu fonksiyonu
+    def _calculate_fitness(self, path: List[int], cost_fn: Callable[[List[int]], float]) -> float:
         try:
-            return self.metrics_service.calculate_weighted_cost(
-                path,
-                weights["delay"],
-                weights["reliability"],
-                weights["resource"],
-                bandwidth_demand # Pass demand to service
-            )
+            return cost_fn(path)
         except Exception:
             return float("inf")
 
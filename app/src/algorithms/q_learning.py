@@ -370,15 +370,23 @@ class QLearning:
         
         [PROJECT COMPLIANCE] Includes both edge and node reliability with -log formula.
         """
-        edge = self.graph.edges[from_node, to_node]
+        # İç dict'lere doğrudan erişim (EdgeView/NodeView nesnesi kurulmaz)
+        edge = self.graph._adj[from_node][to_node]
         
         delay_cost = edge['delay'] / 100
         # [PROJECT COMPLIANCE] -log(LinkReliability) + -log(NodeReliability)
-        edge_rel = max(edge['reliability'], 0.001)
-        node_rel = max(self.graph.nodes[to_node].get('reliability', 0.99), 0.001)
-        rel_cost = (-math.log(edge_rel) + -math.log(node_rel)) / 2  # Normalize per hop
+        # GraphService -log değerlerini yüklemede hesaplar; yoksa burada
+        node = self.graph._node[to_node]
+        edge_nlr = edge.get('neglog_reliability')
+        if edge_nlr is None:
+            edge_nlr = -math.log(max(edge['reliability'], 0.001))
+        node_nlr = node.get('neglog_reliability')
+        if node_nlr is None:
+            node_nlr = -math.log(max(node.get('reliability', 0.99), 0.001))
+        rel_cost = (edge_nlr + node_nlr) / 2  # Normalize per hop
         # [PROJECT COMPLIANCE] ResourceCost = 1Gbps / Bandwidth
-        res_cost = (1000 / max(edge['bandwidth'], 1)) / 100
+        rc = edge.get('resource_cost')
+        res_cost = (rc if rc is not None else 1000 / max(edge['bandwidth'], 1)) / 100
         
         return (
             weights['delay'] * delay_cost +
@@ -19,6 +19,7 @@ from typing import Any, Dict, List, Optional, Callable
 
 import networkx as nx
 
+from src.algorithms._compat import pairwise
 from src.services.metrics_service import MetricsService
 # from src.core.config import settings  # kullanılmıyorsa kaldır
 
@@ -174,6 +175,11 @@ class SimulatedAnnealing:
         self.temperature_history.clear()
         self.acceptance_history.clear()
 
+        # Ağırlıklar koşu boyunca sabit: maliyet fonksiyonu bir kez kurulur
+        cost_fn = self.metrics_service.make_cost_fn(
+            weights["delay"], weights["reliability"], weights["resource"], bandwidth_demand
+        )
+
         current_path = self._initial_solution(source, destination, bandwidth_demand)
 
         # fallback: shortest path
@@ -201,7 +207,7 @@ class SimulatedAnnealing:
                     seed_used=actual_seed
                 )
 
-        current_fit = self._fitness(current_path, weights, bandwidth_demand)
+        current_fit = self._fitness(current_path, cost_fn)
 
         best_path = current_path[:]
         best_fit = current_fit
@@ -233,7 +239,7 @@ class SimulatedAnnealing:
                     it += 1
                     continue
 
-                cand_fit = self._fitness(cand_path, weights, bandwidth_demand)
+                cand_fit = self._fitness(cand_path, cost_fn)
                 delta = cand_fit - current_fit
 
                 # kabul kuralı
@@ -312,7 +318,7 @@ class SimulatedAnnealing:
             return False
         if len(path) != len(set(path)):
             return False
-        for u, v in zip(path[:-1], path[1:]):
+        for u, v in pairwise(path):
             if not self.graph.has_edge(u, v):
                 return False
         return True
@@ -480,17 +486,12 @@ class SimulatedAnnealing:
     # =========================
     # 10) Fitness
     # =========================
-    def _fitness(self, path: List[int], weights: Dict[str, float], bw_demand: float = 0.0) -> float:
+    def _fitness(self, path: List[int], cost_fn: Callable[[List[int]], float]) -> float:
+        """cost_fn: optimize() içinde make_cost_fn ile kurulan koşu fonksiyonu."""
         if not self._is_valid_path(path):
             return float("inf")
 
         try:
-            return self.metrics_service.calculate_weighted_cost(
-                path,
-                weights["delay"],
-                weights["reliability"],
-                weights["resource"],
-                bw_demand
-            )
+            return cost_fn(path)
         except Exception:
             return float("inf")
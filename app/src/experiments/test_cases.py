@@ -231,15 +231,17 @@ class BandwidthConstraintChecker:
         # Yoldaki minimum bant genişliğini bul (darboğaz)
         min_bw = float('inf')
         
+        adj = self.graph._adj
         for i in range(len(path) - 1):
             u, v = path[i], path[i+1]
             
-            # Kenar var mı kontrol et
-            if not self.graph.has_edge(u, v):
+            # Kenar var mı kontrol et (tek sözlük araması: varlık + öznitelikler)
+            edge = adj[u].get(v) if u in adj else None
+            if edge is None:
                 return False, 0.0, "Bağlantı kopuk"
             
             # Bu kenarın bant genişliğini al
-            edge_bw = self.graph.edges[u, v].get('bandwidth', 0)
+            edge_bw = edge.get('bandwidth', 0)
             min_bw = min(min_bw, edge_bw)
         
         # Darboğaz kontrolü
@@ -24,11 +24,14 @@ AĞ MODELİ ÖZELLİKLERİ (Proje Yönergesine Uygun):
 DÜĞÜM ÖZELLİKLERİ:
   - processing_delay (s_ms): Düğümün işleme gecikmesi (milisaniye)
   - reliability (r_node): Düğümün güvenilirlik değeri (0.0 - 1.0)
+  - neglog_reliability: -log(max(reliability, 0.001)), yüklemede bir kez hesaplanır
 
 KENAR ÖZELLİKLERİ:
   - bandwidth (capacity_mbps): Bant genişliği kapasitesi (Mbps)
   - delay (delay_ms): Link gecikmesi (milisaniye)
   - reliability (r_link): Link güvenilirlik değeri (0.0 - 1.0)
+  - neglog_reliability: -log(max(reliability, 0.001)), yüklemede bir kez hesaplanır
+  - resource_cost: 1000 / max(bandwidth, 1) (1Gbps / BW), yüklemede bir kez hesaplanır
 
 KULLANIM ÖRNEĞİ:
 ---------------
@@ -46,6 +49,7 @@ KULLANIM ÖRNEĞİ:
 # KÜTÜPHANE İMPORTLARI
 # =============================================================================
 import os                              # Dosya sistemi işlemleri
+import warnings                        # Boş CSV parçası uyarısını bastırma
 import networkx as nx                  # Graf veri yapısı ve algoritmaları
 import numpy as np                     # Rastgele sayı üretimi için
 from typing import Optional, Dict, Any, List, Tuple  # Tip belirteçleri
@@ -54,6 +58,10 @@ from dataclasses import dataclass      # Veri sınıfları için dekoratör
 # Proje konfigürasyonu (varsayılan değerler)
 from src.core.config import settings
 
+# CSV dosyaları bu kadar satırlık parçalar halinde okunur; metin matrisi
+# tüm dosya için değil yalnızca bir parça için bellekte tutulur.
+CSV_CHUNK_ROWS = 65536
+
 
 # =============================================================================
 # TALEP ÇİFTİ VERİ SINIFI
@@ -81,11 +89,65 @@ class DemandPair:
         DemandPair(source=0, destination=249, demand_mbps=100)
         # 0 numaralı düğümden 249'a 100 Mbps trafik talebi
     """
+    # Örnek başına __dict__ oluşturulmaz (Python 3.9 uyumlu; slots=True 3.10+)
+    __slots__ = ('source', 'destination', 'demand_mbps')
+    
     source: int          # Kaynak düğüm ID'si
     destination: int     # Hedef düğüm ID'si
     demand_mbps: int     # Talep miktarı (Mbps)
 
 
+# =============================================================================
+# ÖZNİTELİK YARDIMCISI
+# =============================================================================
+def _neglog_reliability(reliabilities: np.ndarray) -> List[float]:
+    """
+    -log(max(r, 0.001)) değerlerini tüm dizi için tek NumPy çağrısıyla
+    hesaplar (eleman başına math.log yerine SIMD vektörize log).
+    """
+    return (-np.log(np.maximum(reliabilities, 0.001))).tolist()
+
+
+def _resource_cost(bandwidths: np.ndarray) -> List[float]:
+    """
+    Kenar kaynak maliyeti 1000 / max(bw, 1) (1Gbps / BW); metrik
+    hesabında her yol değerlendirmesinde bölme yapılmaz.
+    """
+    return (1000.0 / np.maximum(bandwidths, 1.0)).tolist()
+
+
+# =============================================================================
+# BAĞLI GRAF DENEMESİ YARDIMCILARI
+# =============================================================================
+def _is_connected_fast(G: nx.Graph) -> bool:
+    """
+    Erken Çıkışlı Bağlılık Kontrolü
+    
+    BFS'ten önce ucuz gerekli koşullar denenir: n-1'den az kenar veya
+    izole bir düğüm varsa graf kesinlikle bağlı değildir. Düşük p
+    değerlerinde reddedilen denemelerin çoğu BFS'e girmeden elenir.
+    """
+    n = G.number_of_nodes()
+    if n == 0:
+        return False
+    if G.number_of_edges() < n - 1:
+        return False
+    if any(not nbrs for nbrs in G._adj.values()):
+        return False  # İzole düğüm
+    return len(nx.node_connected_component(G, next(iter(G)))) == n
+
+
+def _try_build_connected(n_nodes: int, p: float, seed: int) -> Optional[nx.Graph]:
+    """
+    Tek Bir Bağlı Graf Denemesi
+    
+    Verilen seed ile Erdős–Rényi grafı üretir; bağlıysa grafı, değilse
+    None döndürür.
+    """
+    G = nx.erdos_renyi_graph(n_nodes, p, seed=seed)
+    return G if _is_connected_fast(G) else None
+
+
 # =============================================================================
 # GRAF SERVİSİ ANA SINIFI
 # =============================================================================
@@ -165,6 +227,19 @@ class GraphService:
         # "generated": Rastgele oluşturuldu
         # "csv": CSV dosyalarından yüklendi
         self._data_source: str = "generated"
+        
+        # ----------------------------------------------------------------
+        # Türetilmiş bilgi önbellekleri
+        # ----------------------------------------------------------------
+        # Bağlılık kontrolü O(n+m) BFS gerektirir; graf değişmedikçe
+        # tekrar hesaplanmaz. None = henüz hesaplanmadı.
+        self._is_connected_cache: Optional[bool] = None
+        
+        # Temel sayaçlar: (düğüm, kenar, ortalama derece) - get_graph_info için
+        self._stats_cache: Optional[Tuple[int, int, float]] = None
+        
+        # Spring layout sonuçları: boyut (2/3) -> {düğüm: koordinat}
+        self._layout_cache: Dict[int, Dict[int, np.ndarray]] = {}
 
 
     # =================================================================================================================
@@ -247,6 +322,12 @@ class GraphService:
         # ----------------------------------------------------------------
         # Her kenar: bandwidth, delay ve reliability özelliklerine sahip
         self._load_edges_from_csv(G, edge_file)
+
+        # NodeData'da olmayıp yalnızca kenarla eklenen düğümlere varsayılanlar:
+        # metrik kodu özniteliklerin her düğümde bulunduğunu varsayar
+        for _, data in G.nodes(data=True):
+            if 'processing_delay' not in data:
+                data.update(processing_delay=0.0, reliability=1.0, neglog_reliability=0.0)
         
         # ----------------------------------------------------------------
         # ADIM 3: Talep (Demand) verilerini yükle
@@ -259,19 +340,47 @@ class GraphService:
         # ----------------------------------------------------------------
         self.graph = G
         self._data_source = "csv"
+        self.invalidate_caches()
         return G
     
-    def _parse_turkish_float(self, value: str) -> float:
+    def _read_csv_matrix(self, filepath: str) -> np.ndarray:
         """
-        Türkçe Ondalık Sayı Dönüştürücü
-
+        Sayısal CSV Dosyasını Matris Olarak Oku
+        
+        Satırlar Python'da tek tek bölünmek yerine np.loadtxt'in C
+        ayrıştırıcısı ile metin matrisi olarak okunur; başlık satırı
+        atlanır, boş satırlar yok sayılır.
+        
+        Türkçe ondalık virgüller ("0,95") alan başına Python fonksiyonu
+        çağırmak yerine matris üzerinde tek bir np.char.replace ile
+        noktaya çevrilir, ardından tek astype ile float'a dönüştürülür.
+        
+        Dosya açık tutularak CSV_CHUNK_ROWS satırlık parçalar halinde
+        okunur; her parça hemen float'a çevrildiği için (float'tan kat kat
+        büyük) metin matrisi hiçbir zaman tüm dosya için oluşmaz.
+        
         Args:
-            value: Türkçe formatlı sayı string'i ("0,95")
+            filepath: Noktalı virgülle ayrılmış CSV dosya yolu
             
         Returns:
-            float: Python float değeri (0.95)
+            np.ndarray: (satır, sütun) boyutlu float64 matris
         """
-        return float(value.replace(',', '.'))
+        chunks = []
+        with open(filepath, 'r', encoding='utf-8') as f, warnings.catch_warnings():
+            # Dosya sonunda boş parça okunursa loadtxt uyarı verir
+            warnings.simplefilter('ignore', UserWarning)
+            next(f, None)  # İlk satır başlık (atla)
+            
+            while True:
+                raw = np.loadtxt(f, delimiter=';', dtype=str, ndmin=2, max_rows=CSV_CHUNK_ROWS)
+                if raw.size:
+                    chunks.append(np.char.replace(raw, ',', '.').astype(np.float64))
+                if raw.shape[0] < CSV_CHUNK_ROWS:
+                    break
+        
+        if not chunks:
+            return np.empty((0, 0), dtype=np.float64)  # Sadece başlık satırı
+        return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
     
     def _load_nodes_from_csv(self, G: nx.Graph, filepath: str) -> None:
         """
@@ -293,29 +402,24 @@ class GraphService:
             G: Düğümlerin ekleneceği NetworkX grafı
             filepath: NodeData.csv dosya yolu
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        # ----------------------------------------------------------------
+        # Tüm dosyayı NumPy'ın C ayrıştırıcısı ile tek seferde oku
+        # ----------------------------------------------------------------
+        # İlk satır başlık: node_id;s_ms;r_node (skiprows=1 ile atlanır)
+        # Türkçe ondalık virgüller tüm matriste tek seferde çevrilir.
+        data = self._read_csv_matrix(filepath)
         
-        # İlk satır başlık: node_id;s_ms;r_node (atla)
-        for line in lines[1:]:
-            line = line.strip()
-            if not line:
-                continue  # Boş satırları atla
-            
-            parts = line.split(';')
-            if len(parts) >= 3:
-                node_id = int(parts[0])
-                
-                # s_ms -> processing_delay (Türkçe format)
-                processing_delay = self._parse_turkish_float(parts[1])
-                
-                # r_node -> reliability (Türkçe format)
-                reliability = self._parse_turkish_float(parts[2])
-                
-                # Düğümü grafa ekle
-                G.add_node(node_id, 
-                          processing_delay=processing_delay,
-                          reliability=reliability)
+        node_ids = data[:, 0].astype(np.int64).tolist()
+        processing_delays = data[:, 1].tolist()   # s_ms -> processing_delay
+        reliabilities = data[:, 2].tolist()       # r_node -> reliability
+        # neglog_reliability: ReliabilityCost terimi, metrik hesabında tekrar log alınmaz
+        neglogs = _neglog_reliability(data[:, 2])
+        
+        # Düğümleri toplu olarak grafa ekle
+        G.add_nodes_from(
+            (node_id, {'processing_delay': pd, 'reliability': rel, 'neglog_reliability': nlr})
+            for node_id, pd, rel, nlr in zip(node_ids, processing_delays, reliabilities, neglogs)
+        )
     
     def _load_edges_from_csv(self, G: nx.Graph, filepath: str) -> None:
         """
@@ -343,28 +447,23 @@ class GraphService:
             G: Kenarların ekleneceği NetworkX grafı
             filepath: EdgeData.csv dosya yolu
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # İlk satır başlık (atla)
-        for line in lines[1:]:
-            line = line.strip()
-            if not line:
-                continue
-            
-            parts = line.split(';')
-            if len(parts) >= 5:
-                src = int(parts[0])
-                dst = int(parts[1])
-                bandwidth = float(parts[2])      # capacity_mbps
-                delay = float(parts[3])          # delay_ms
-                reliability = self._parse_turkish_float(parts[4])  # r_link
-                
-                # Kenarı grafa ekle (özelliklerle birlikte)
-                G.add_edge(src, dst,
-                          bandwidth=bandwidth,
-                          delay=delay,
-                          reliability=reliability)
+        data = self._read_csv_matrix(filepath)
+        
+        src = data[:, 0].astype(np.int64).tolist()
+        dst = data[:, 1].astype(np.int64).tolist()
+        bandwidths = data[:, 2].tolist()      # capacity_mbps
+        delays = data[:, 3].tolist()          # delay_ms
+        reliabilities = data[:, 4].tolist()   # r_link
+        neglogs = _neglog_reliability(data[:, 4])
+        resource_costs = _resource_cost(data[:, 2])
+        
+        # Kenarları toplu olarak grafa ekle (özelliklerle birlikte)
+        G.add_edges_from(
+            (u, v, {'bandwidth': bw, 'delay': delay, 'reliability': rel,
+                    'neglog_reliability': nlr, 'resource_cost': rc})
+            for u, v, bw, delay, rel, nlr, rc in zip(src, dst, bandwidths, delays,
+                                                     reliabilities, neglogs, resource_costs)
+        )
     
     def _load_demands_from_csv(self, filepath: str) -> None:
         """
@@ -392,27 +491,16 @@ class GraphService:
         """
         self.demands = []  # Önceki talepleri temizle
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        # Düğüm/kenar dosyalarıyla aynı C ayrıştırıcısı; tüm talepler tek matris
+        data = self._read_csv_matrix(filepath).astype(np.int64)
+        if data.size == 0:
+            return
         
-        # İlk satır başlık (atla)
-        for line in lines[1:]:
-            line = line.strip()
-            if not line:
-                continue
-            
-            parts = line.split(';')
-            if len(parts) >= 3:
-                src = int(parts[0])
-                dst = int(parts[1])
-                demand = int(parts[2])
-                
-                # DemandPair nesnesi oluştur ve listeye ekle
-                self.demands.append(DemandPair(
-                    source=src,
-                    destination=dst,
-                    demand_mbps=demand
-                ))
+        # DemandPair nesnelerini oluştur
+        self.demands = [
+            DemandPair(source=src, destination=dst, demand_mbps=demand)
+            for src, dst, demand in data[:, :3].tolist()
+        ]
     
     def get_demands(self) -> List[DemandPair]:
         """Yüklenen talep çiftlerini döndürür."""
@@ -493,20 +581,19 @@ class GraphService:
         # BAĞLI GRAF OLUŞTURMA DÖNGÜSÜ
         # ----------------------------------------------------------------
         # Düşük p değerlerinde graf bağlı olmayabilir.
-        # Bu döngü bağlı graf bulana kadar farklı seed'ler dener.
-        attempt = 0
+        # Farklı seed'ler (self.seed + deneme no) bağlı graf bulunana
+        # kadar seri denenir. Her deneme milisaneyeler sürer; süreç havuzu
+        # başlatma maliyeti kazancı aşar. Bağlı olmayan denemelerin çoğu
+        # _is_connected_fast'in ucuz kontrolleriyle BFS'siz elenir.
         max_attempts = 100
         
-        while attempt < max_attempts:
-            # Erdős–Rényi graf oluştur
-            G = nx.erdos_renyi_graph(n_nodes, p, seed=self.seed + attempt)
-            
-            # Bağlılık kontrolü
-            if nx.is_connected(G):
+        G = None
+        for attempt in range(max_attempts):
+            G = _try_build_connected(n_nodes, p, self.seed + attempt)
+            if G is not None:
                 break  # Bağlı graf bulundu!
-            
-            attempt += 1
-        else:
+        
+        if G is None:
             # ----------------------------------------------------------------
             # FALLBACK: Bileşenleri manuel olarak bağla
             # ----------------------------------------------------------------
@@ -533,6 +620,10 @@ class GraphService:
         self.graph = G
         self._data_source = "generated"
         self.demands = []  # Rastgele graf için demand yok
+        self.invalidate_caches()
+        
+        # Yukarıdaki döngü/fallback bağlılığı garanti eder, BFS gereksiz
+        self._is_connected_cache = True
         return G
     
     def _assign_node_attributes(self, G: nx.Graph) -> None:
@@ -549,21 +640,33 @@ class GraphService:
            
         2. reliability: Rastgele [NODE_RELIABILITY_MIN, NODE_RELIABILITY_MAX]
            Varsayılan: [0.95, 0.999]
+           
+        3. neglog_reliability: -log(reliability), metrik hesabı için önceden
         
         Args:
             G: Özelliklerin ekleneceği NetworkX grafı
         """
-        for node in G.nodes():
-            # İşleme gecikmesi (ms) - uniform dağılım
-            G.nodes[node]['processing_delay'] = self._rng.uniform(
-                settings.PROCESSING_DELAY_MIN, 
-                settings.PROCESSING_DELAY_MAX
-            )
-            
-            # Düğüm güvenilirliği (0.0-1.0) - uniform dağılım
-            G.nodes[node]['reliability'] = self._rng.uniform(
-                settings.NODE_RELIABILITY_MIN, 
-                settings.NODE_RELIABILITY_MAX
+        # ----------------------------------------------------------------
+        # Tüm düğümlerin değerlerini tek RNG çağrısıyla (n, 2) dizi olarak çek
+        # ----------------------------------------------------------------
+        # Sütun 0: processing_delay (ms), sütun 1: reliability (0.0-1.0)
+        # Satır-öncelikli çekim, düğüm başına iki ayrı uniform() çağrısıyla
+        # aynı sayı dizisini üretir -> aynı seed ile aynı graf korunur.
+        draws = self._rng.uniform(
+            (settings.PROCESSING_DELAY_MIN, settings.NODE_RELIABILITY_MIN),
+            (settings.PROCESSING_DELAY_MAX, settings.NODE_RELIABILITY_MAX),
+            size=(G.number_of_nodes(), 2)
+        )
+        processing_delays = draws[:, 0].tolist()
+        reliabilities = draws[:, 1].tolist()
+        neglogs = _neglog_reliability(draws[:, 1])
+        
+        # Düğüm başına tek dict güncellemesi (öznitelik başına görünüm araması yok)
+        for (_, data), pd, rel, nlr in zip(G.nodes(data=True), processing_delays, reliabilities, neglogs):
+            data.update(
+                processing_delay=pd,
+                reliability=rel,
+                neglog_reliability=nlr
             )
     
     def _assign_edge_attributes(self, G: nx.Graph) -> None:
@@ -583,27 +686,37 @@ class GraphService:
            
         3. reliability: Rastgele [LINK_RELIABILITY_MIN, LINK_RELIABILITY_MAX]
            Varsayılan: [0.95, 0.999]
+           
+        4. neglog_reliability: -log(reliability), metrik hesabı için önceden
+        
+        5. resource_cost: 1000 / bandwidth, metrik hesabı için önceden
         
         Args:
             G: Özelliklerin ekleneceği NetworkX grafı
         """
-        for u, v in G.edges():
-            # Bant genişliği (Mbps)
-            G.edges[u, v]['bandwidth'] = self._rng.uniform(
-                settings.BANDWIDTH_MIN, 
-                settings.BANDWIDTH_MAX
-            )
-            
-            # Link gecikmesi (ms)
-            G.edges[u, v]['delay'] = self._rng.uniform(
-                settings.LINK_DELAY_MIN, 
-                settings.LINK_DELAY_MAX
-            )
-            
-            # Link güvenilirliği
-            G.edges[u, v]['reliability'] = self._rng.uniform(
-                settings.LINK_RELIABILITY_MIN, 
-                settings.LINK_RELIABILITY_MAX
+        # Sütunlar: bandwidth (Mbps), delay (ms), reliability
+        # Satır-öncelikli tek çekim, kenar başına üç uniform() çağrısıyla
+        # aynı sayı dizisini üretir (tekrarlanabilirlik korunur).
+        draws = self._rng.uniform(
+            (settings.BANDWIDTH_MIN, settings.LINK_DELAY_MIN, settings.LINK_RELIABILITY_MIN),
+            (settings.BANDWIDTH_MAX, settings.LINK_DELAY_MAX, settings.LINK_RELIABILITY_MAX),
+            size=(G.number_of_edges(), 3)
+        )
+        bandwidths = draws[:, 0].tolist()
+        delays = draws[:, 1].tolist()
+        reliabilities = draws[:, 2].tolist()
+        neglogs = _neglog_reliability(draws[:, 2])
+        resource_costs = _resource_cost(draws[:, 0])
+        
+        # Kenar başına tek dict güncellemesi (G.edges[u, v] görünümü kurulmaz)
+        for (_, _, data), bw, delay, rel, nlr, rc in zip(G.edges(data=True), bandwidths, delays,
+                                                          reliabilities, neglogs, resource_costs):
+            data.update(
+                bandwidth=bw,
+                delay=delay,
+                reliability=rel,
+                neglog_reliability=nlr,
+                resource_cost=rc
             )
 
 
@@ -638,12 +751,23 @@ class GraphService:
         if self.graph is None:
             return {"error": "No graph generated yet"}
         
+        # Bağlılık sonucu önbellekten (graf değişmedikçe BFS tekrarlanmaz)
+        if self._is_connected_cache is None:
+            self._is_connected_cache = nx.is_connected(self.graph)
+        
+        # Sayaçlar da önbellekten; ortalama derece = 2m / n (derece dict'i kurulmaz)
+        if self._stats_cache is None:
+            n = self.graph.number_of_nodes()
+            m = self.graph.number_of_edges()
+            self._stats_cache = (n, m, 2 * m / n if n else 0.0)
+        node_count, edge_count, average_degree = self._stats_cache
+        
         # Temel istatistikler
         info = {
-            "node_count": self.graph.number_of_nodes(),
-            "edge_count": self.graph.number_of_edges(),
-            "is_connected": nx.is_connected(self.graph),
-            "average_degree": sum(dict(self.graph.degree()).values()) / self.graph.number_of_nodes(),
+            "node_count": node_count,
+            "edge_count": edge_count,
+            "is_connected": self._is_connected_cache,
+            "average_degree": average_degree,
             "data_source": self._data_source
         }
         
@@ -655,6 +779,20 @@ class GraphService:
         
         return info
     
+    def invalidate_caches(self) -> None:
+        """
+        Önbellekleri Geçersiz Kıl
+        =========================
+        
+        Graftan türetilen önbelleğe alınmış bilgileri temizler.
+        Graf yüklendiğinde/oluşturulduğunda otomatik çağrılır; graf
+        dışarıdan değiştirildiğinde (örn. UI'da link kırma) elle
+        çağrılmalıdır.
+        """
+        self._is_connected_cache = None
+        self._stats_cache = None
+        self._layout_cache.clear()
+    
     def get_node_positions(self, dim: int = 2) -> Dict[int, tuple]:
         """
         Düğüm Pozisyonlarını Hesapla
@@ -674,6 +812,12 @@ class GraphService:
                  2: 2D görselleştirme için
                  3: 3D görselleştirme için
         
+        ÖNBELLEK:
+        ---------
+        Layout O(iterasyon × N²) maliyetlidir; sonuç boyut başına saklanır
+        ve graf yeniden yüklenene/oluşturulana kadar (invalidate_caches)
+        tekrar hesaplanmaz. Dönen sözlük paylaşımlıdır, değiştirilmemelidir.
+        
         Returns:
             Dict[int, tuple]: {node_id: (x, y) veya (x, y, z)}
             
@@ -684,16 +828,22 @@ class GraphService:
         if self.graph is None:
             return {}
         
+        positions = self._layout_cache.get(dim)
+        if positions is not None:
+            return positions
+        
         # k parametresi: ideal düğüm-düğüm mesafesi
         # Düğüm sayısı arttıkça k küçülür (daha sıkı yerleşim)
         k = 2 / np.sqrt(self.graph.number_of_nodes())
         
-        return nx.spring_layout(
+        positions = nx.spring_layout(
             self.graph, 
             seed=self.seed,  # Tekrarlanabilir pozisyonlar
             k=k, 
             dim=dim
         )
+        self._layout_cache[dim] = positions
+        return positions
     
     def has_path(self, source: int, destination: int) -> bool:
         """
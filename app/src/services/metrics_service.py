@@ -11,12 +11,23 @@ FORMÜLLER:
 4. WeightedCost = w₁×Delay + w₂×Reliability + w₃×Resource
 """
 
-from dataclasses import dataclass
-from typing import List, Dict
-from functools import lru_cache
 import math
+import sys
+from dataclasses import dataclass
+from typing import Callable, List, Dict, Optional, Tuple, Union
+import numpy as np
 import networkx as nx
 
+# Numba opsiyonel: yoksa NumPy ile vektörize yol kullanılır
+try:
+    from numba import njit, prange
+    from numba.core.errors import NumbaError
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    NumbaError = RuntimeError  # Yalnızca except bloğunda adı geçer
+
 
 # Normalizasyon sabitleri
 class NormConfig:
@@ -26,9 +37,13 @@ class NormConfig:
     MAX_RELIABILITY_COST = 10.0  # 40 × -log(0.95) ≈ 2, güvenlik payı=10
 
 
-@dataclass 
+# Varsayılanlı alanlarla elle __slots__ tanımlanamaz; slots=True 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PathMetrics:
-    """Yol metrikleri veri sınıfı."""
+    """Yol metrikleri veri sınıfı (değişmez; önbellekten paylaşılır)."""
     total_delay: float           # Toplam gecikme (ms)
     total_reliability: float     # Çarpımsal güvenilirlik (0-1)
     resource_cost: float         # Normalize kaynak maliyeti (0-1)
@@ -37,10 +52,163 @@ class PathMetrics:
     reliability_cost: float = 0.0        # Ham -log maliyeti
 
 
+def _path_metrics_kernel(path, bw_demand, node_delay, node_neglog_rel,
+                         adj_indptr, adj_indices, adj_eidx,
+                         edge_delay, edge_neglog_rel, edge_bw, edge_resource):
+    """
+    Tek yolun ham metriklerini düz döngüyle hesaplar (Numba çekirdeği).
+
+    Toplama sırası orijinal döngüyle aynıdır: önce düğümler, sonra
+    kenarlar. Her adımın kenar indeksi CSR komşuluğunda (u satırının
+    sıralı komşuları) ikili aramayla bulunur; kenar yoksa valid=False döner.
+    bw_demand > 0 ise darboğazı talebin altında kalan ilk kenarda kalan
+    adımlar atlanır ve valid=False döner (ağırlıklı maliyet zaten inf).
+
+    Çarpımsal güvenilirlik burada biriktirilmez; gerektiğinde
+    exp(-reliability_cost) olarak türetilir (uzun yollarda alttan taşmaz).
+
+    Returns:
+        (valid, total_delay, reliability_cost, raw_resource, min_bw)
+    """
+    n_nodes = node_delay.shape[0]
+    source = path[0]
+    destination = path[path.shape[0] - 1]
+
+    total_delay = 0.0
+    reliability_cost = 0.0
+    raw_resource = 0.0
+    min_bw = np.inf
+
+    # === DÜĞÜM METRİKLERİ ===
+    for i in range(path.shape[0]):
+        node = path[i]
+        if node < 0 or node >= n_nodes:
+            raise IndexError("Yol grafta olmayan bir düğüm içeriyor")
+        if node != source and node != destination:
+            total_delay += node_delay[node]
+        reliability_cost += node_neglog_rel[node]
+
+    # === KENAR METRİKLERİ ===
+    for i in range(path.shape[0] - 1):
+        u = path[i]
+        v = path[i + 1]
+
+        # u satırında v için ikili arama
+        lo = adj_indptr[u]
+        end = adj_indptr[u + 1]
+        hi = end
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if adj_indices[mid] < v:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == end or adj_indices[lo] != v:
+            return False, 0.0, 0.0, 0.0, 0.0
+
+        k = adj_eidx[lo]
+        total_delay += edge_delay[k]
+        reliability_cost += edge_neglog_rel[k]
+        bw = edge_bw[k]
+        if bw_demand > 0.0 and bw < bw_demand:
+            return False, 0.0, 0.0, 0.0, 0.0
+        if bw < min_bw:
+            min_bw = bw
+        raw_resource += edge_resource[k]
+
+    return True, total_delay, reliability_cost, raw_resource, min_bw
+
+
+# Derleme ilk çağrıda yapılır; cache=True ile sonraki açılışlarda diskten yüklenir
+_path_metrics_jit = njit(cache=True)(_path_metrics_kernel) if NUMBA_AVAILABLE else None
+
+
+def _batch_costs_kernel(paths, lengths, delay_w, reliability_w, resource_w, bw_demand,
+                        max_delay, max_reliability_cost, node_delay, node_neglog_rel,
+                        adj_indptr, adj_indices, adj_eidx,
+                        edge_delay, edge_neglog_rel, edge_bw, edge_resource):
+    """
+    Dolgulu (P, L_max) yol matrisinin ağırlıklı maliyetlerini hesaplar.
+
+    Her satır bağımsızdır; paralel derlemede prange satırları çekirdeklere
+    dağıtır. Numba sınıf niteliklerini okuyamadığı için NormConfig
+    değerleri argüman olarak gelir. Geçersiz yol / bant genişliği ihlali → inf.
+    """
+    n_paths = paths.shape[0]
+    costs = np.empty(n_paths)
+    for i in prange(n_paths):
+        length = lengths[i]
+        if length < 2:
+            costs[i] = np.inf
+            continue
+        valid, total_delay, reliability_cost, raw_resource, min_bw = _path_metrics_jit(
+            paths[i, :length], bw_demand, node_delay, node_neglog_rel,
+            adj_indptr, adj_indices, adj_eidx,
+            edge_delay, edge_neglog_rel, edge_bw, edge_resource
+        )
+        if not valid:
+            costs[i] = np.inf
+            continue
+        # Sıfır ağırlıklı terimler atlanır (tek amaçlı yönlendirmede yaygın)
+        cost = 0.0
+        if delay_w != 0.0:
+            cost += delay_w * min(total_delay / max_delay, 1.0)
+        if reliability_w != 0.0:
+            cost += reliability_w * min(reliability_cost / max_reliability_cost, 1.0)
+        if resource_w != 0.0:
+            cost += resource_w * min(raw_resource / 200.0, 1.0)
+        costs[i] = cost
+    return costs
+
+
+# Seri ve paralel varyant; paralel derleme başarısız olursa seri kullanılır
+_batch_costs_jit = njit(cache=True)(_batch_costs_kernel) if NUMBA_AVAILABLE else None
+_batch_costs_parallel_jit = njit(parallel=True, cache=True)(_batch_costs_kernel) if NUMBA_AVAILABLE else None
+
+# Bu boyutun altındaki popülasyonlarda iş parçacığı başlatma maliyeti kazançtan büyük
+BATCH_PARALLEL_MIN = 64
+
+# Önceden derlenmiş (AOT) çekirdekler: build_metrics_ext.py ile üretilir.
+# Varsa ilk çağrıdaki JIT derleme gecikmesi ortadan kalkar; imzalar veya
+# çekirdek mantığı değişirse AOT_ABI_VERSION artırılmalıdır.
+AOT_ABI_VERSION = 3
+AOT_PATH_SIGNATURE = (
+    'Tuple((b1, f8, f8, f8, f8))'
+    '(i8[:], f8, f8[:], f8[:], i8[:], i8[:], i8[:], f8[:], f8[:], f8[:], f8[:])'
+)
+AOT_BATCH_SIGNATURE = (
+    'f8[:](i8[:, :], i8[:], f8, f8, f8, f8, f8, f8, '
+    'f8[:], f8[:], i8[:], i8[:], i8[:], f8[:], f8[:], f8[:], f8[:])'
+)
+
+try:
+    from . import metrics_ext as _metrics_ext
+    if _metrics_ext.abi_version() != AOT_ABI_VERSION:
+        raise ImportError("metrics_ext güncel değil; build_metrics_ext.py ile yeniden derleyin")
+    _path_metrics_aot = _metrics_ext.path_metrics
+    _batch_costs_aot = _metrics_ext.batch_costs
+except ImportError:
+    _path_metrics_aot = None
+    _batch_costs_aot = None
+
+# Örnek başına maliyet önbelleği kapasitesi (en eski kayıt atılır)
+COST_CACHE_SIZE = 20000
+
+
 class MetricsService:
     """
     Metrik Hesaplama Servisi
     
+    Graf öznitelikleri kurulumda düğüm/kenar indeksli NumPy dizilerine
+    (SoA) kopyalanır.
+    Numba kuruluysa yol metrikleri derlenmiş çekirdekle, değilse bu
+    dizilerden toplu NumPy indeksleme ile hesaplanır.
+
+    Diziler ve önbellekler kurulum anındaki grafı yansıtır; bir örnek tek
+    bir çalıştırma (worker, algoritma örneği) içindir. Uygulamadaki tüm
+    kullanımlar her çalıştırmada yeni örnek oluşturur. Graf değişirken
+    örneği elde tutan çağıran invalidate() çağırmalıdır.
+
     Kullanım:
         service = MetricsService(graph)
         metrics = service.calculate_all(path, 0.33, 0.33, 0.34)
@@ -48,19 +216,214 @@ class MetricsService:
     """
 
     def __init__(self, graph: nx.Graph):
-        """Graf referansını sakla."""
+        """Graf referansını sakla ve öznitelik dizilerini hazırla."""
         self.graph = graph
+        self._build_arrays()
+
+        # Örneğe ait önbellek: servis silinince graf da serbest kalır.
+        # Anahtar yalnızca yol; ağırlıklar değişince önbellek boşaltılır.
+        self._cost_cache: Dict[tuple, float] = {}
+        self._cache_weights: Optional[Tuple[float, float, float, float]] = None
+        # calculate_all sonuçları: (yol, ağırlıklar) -> paylaşılan PathMetrics
+        self._all_cache: Dict[tuple, PathMetrics] = {}
+
+    def invalidate(self) -> None:
+        """
+        Örnek elde tutulurken graf değişirse (örn. UI'da link kırma)
+        çağrılır: öznitelik dizilerini yeniden kurar ve tüm önbellekleri
+        boşaltır. Her çalıştırmada yeni örnek oluşturan çağıranların
+        çağırması gerekmez.
+        """
+        self._build_arrays()
+        self._cost_cache.clear()
+        self._cache_weights = None
+        self._all_cache.clear()
+
+    def _build_arrays(self) -> None:
+        """
+        Düğüm/kenar özniteliklerini yoğun NumPy dizilerine kopyalar.
+
+        Düğüm etiketleri 0..N-1 ise doğrudan dizi indeksi olarak kullanılır;
+        değilse (seyrek ya da int olmayan etiketler) _nidx sözlüğü ile
+        sıkıştırılmış indekslere çevrilir. Kenar öznitelikleri kenar indeksine göre E uzunluklu ayrı dizilerde
+        (SoA) tutulur; (u, v) -> kenar indeksi eşlemesi CSR komşuluğu
+        (indptr, satır içi sıralı indices, eidx) ile yapılır, bellek O(N + E).
+        """
+        graph = self.graph
+        n = graph.number_of_nodes()
+
+        # Düğüm etiketi -> dizi indeksi (None = etiketler zaten 0..N-1)
+        nidx = None if set(graph.nodes()) == set(range(n)) else {
+            node: i for i, node in enumerate(graph.nodes())
+        }
+        self._nidx = nidx
+
+        # === DÜĞÜM DİZİLERİ ===
+        self._node_delay = np.zeros(n)
+        node_rel = np.ones(n)
+        self._node_neglog_rel = np.zeros(n)
+        for node, data in graph.nodes(data=True):
+            i = node if nidx is None else nidx[node]
+            self._node_delay[i] = float(data.get('processing_delay', 0.0))
+            node_rel[i] = float(data.get('reliability', 1.0))
+            self._node_neglog_rel[i] = float(data.get('neglog_reliability', np.nan))
+
+        # GraphService dışında kurulan graflarda -log burada hesaplanır
+        missing = np.isnan(self._node_neglog_rel)
+        self._node_neglog_rel[missing] = -np.log(np.maximum(node_rel[missing], 0.001))
+
+        # === KENAR DİZİLERİ (SoA) ===
+        us, vs, delays, rels, neglogs, bws, resources = [], [], [], [], [], [], []
+        for u, v, data in graph.edges(data=True):
+            us.append(u if nidx is None else nidx[u])
+            vs.append(v if nidx is None else nidx[v])
+            delays.append(float(data.get('delay', 0.0)))
+            rels.append(float(data.get('reliability', 1.0)))
+            neglogs.append(float(data.get('neglog_reliability', np.nan)))
+            bws.append(float(data.get('bandwidth', 1000.0)))
+            resources.append(float(data.get('resource_cost', np.nan)))
+
+        self._edge_delay = np.array(delays, dtype=np.float64)
+        self._edge_bw = np.array(bws, dtype=np.float64)
+        self._edge_neglog_rel = np.array(neglogs, dtype=np.float64)
+        missing = np.isnan(self._edge_neglog_rel)
+        self._edge_neglog_rel[missing] = -np.log(np.maximum(np.array(rels)[missing], 0.001))
+
+        # Kaynak maliyeti: OSPF benzeri (Cost = 1Gbps / BW), eksikse burada
+        self._edge_resource = np.array(resources, dtype=np.float64)
+        missing = np.isnan(self._edge_resource)
+        self._edge_resource[missing] = 1000.0 / np.maximum(self._edge_bw[missing], 1.0)
+
+        # === CSR KOMŞULUK ===
+        # Yönsüz graf: her kenar hem u hem v satırına yazılır; satır içinde
+        # komşular sıralı olduğundan (satır, sütun) anahtarları da küresel sıralı
+        us = np.array(us, dtype=np.int64)
+        vs = np.array(vs, dtype=np.int64)
+        edge_idx = np.arange(us.shape[0], dtype=np.int64)
+        rows = np.concatenate((us, vs))
+        cols = np.concatenate((vs, us))
+        order = np.lexsort((cols, rows))
+        self._adj_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=self._adj_indptr[1:])
+        self._adj_indices = cols[order]
+        self._adj_eidx = np.concatenate((edge_idx, edge_idx))[order]
+
+        # NumPy yedeği için paketli (u * N + v) anahtarlar: searchsorted ile arama
+        self._adj_keys = rows[order] * n + self._adj_indices
+
+        # Çekirdeğe her çağrıda aynı sırayla verilen diziler
+        self._kernel_arrays = (
+            self._node_delay, self._node_neglog_rel,
+            self._adj_indptr, self._adj_indices, self._adj_eidx,
+            self._edge_delay, self._edge_neglog_rel, self._edge_bw, self._edge_resource
+        )
+
+    def _to_index(self, path: List[int]) -> np.ndarray:
+        """Yol düğüm etiketlerini int64 dizi indekslerine çevirir."""
+        if self._nidx is None:
+            return np.asarray(path, dtype=np.int64)
+        nidx = self._nidx
+        return np.fromiter((nidx[node] for node in path), dtype=np.int64, count=len(path))
+
+    def _path_metrics_numpy(self, p: np.ndarray, bw_demand: float = 0.0) -> tuple:
+        """
+        Numba yokken kullanılan vektörize yol (çekirdekle aynı çıktı).
+        Bant genişliği ihlali diğer toplamlardan önce tek indirgemeyle
+        kontrol edilir.
+
+        Returns:
+            (valid, total_delay, reliability_cost, raw_resource, min_bw)
+        """
+        # Graf dışı düğüm → IndexError (çekirdekle aynı davranış); negatif
+        # indeks NumPy'de sondan sayılacağından ayrıca reddedilir
+        if p.size and p.min() < 0:
+            raise IndexError("Yol grafta olmayan bir düğüm içeriyor")
+        node_delay = self._node_delay[p]
+
+        keys = self._adj_keys
+        query = p[:-1] * self._node_delay.shape[0] + p[1:]
+        pos = np.searchsorted(keys, query)
+
+        # Graf üzerinde olmayan kenar → geçersiz yol
+        if keys.shape[0] == 0 or (pos == keys.shape[0]).any() or (keys[pos] != query).any():
+            return False, 0.0, 0.0, 0.0, 0.0
+        k = self._adj_eidx[pos]
+        edge_bw = self._edge_bw[k]
+        min_bw = float(edge_bw.min())
+        if bw_demand > 0 and min_bw < bw_demand:
+            return False, 0.0, 0.0, 0.0, 0.0
+        edge_delay = self._edge_delay[k]
+
+        # ProcessingDelay: Sadece ARA düğümler (S,D hariç)
+        inner = (p != p[0]) & (p != p[-1])
+        total_delay = float(node_delay[inner].sum() + edge_delay.sum())
+
+        # Reliability: TÜM düğümler + tüm kenarlar
+        reliability_cost = float(
+            self._node_neglog_rel[p].sum() + self._edge_neglog_rel[k].sum()
+        )
+
+        # Kaynak maliyeti: OSPF benzeri (Cost = 1Gbps / BW)
+        raw_resource = float(self._edge_resource[k].sum())
+
+        return True, total_delay, reliability_cost, raw_resource, min_bw
+
+    def _raw_metrics(self, path: List[int], bw_demand: float = 0.0):
+        """
+        Yolun ham metriklerini çekirdek (veya NumPy yedeği) ile hesaplar.
+
+        Returns:
+            (total_delay, reliability_cost, raw_resource, min_bw) veya
+            geçersiz yol / bant genişliği ihlali (bw_demand > 0) için None
+        """
+        # Geçersiz yol kontrolü (liste, tuple veya int dizisi)
+        if path is None or len(path) < 2:
+            return None
+
+        p = self._to_index(path)
+        if _path_metrics_aot is not None:
+            result = _path_metrics_aot(p, bw_demand, *self._kernel_arrays)
+        elif _path_metrics_jit is not None:
+            result = _path_metrics_jit(p, bw_demand, *self._kernel_arrays)
+        else:
+            result = self._path_metrics_numpy(p, bw_demand)
+
+        return result[1:] if result[0] else None
 
-    @lru_cache(maxsize=10000)
     def calculate_weighted_cost_cached(
-        self, path_tuple: tuple, 
+        self, path: Union[tuple, np.ndarray],
         delay_w: float, reliability_w: float, resource_w: float,
         bw_demand: float = 0.0
     ) -> float:
-        """Önbellekli ağırlıklı maliyet hesaplama (performans için)."""
-        return self.calculate_weighted_cost(
-            list(path_tuple), delay_w, reliability_w, resource_w, bw_demand
+        """
+        Önbellekli ağırlıklı maliyet hesaplama (performans için).
+
+        path tuple ya da int NumPy dizisi olabilir; dizi anahtarı tek
+        geçişte hashlenen tobytes() ile oluşturulur.
+        """
+        cache = self._cost_cache
+        weights = (delay_w, reliability_w, resource_w, bw_demand)
+        if weights != self._cache_weights:
+            cache.clear()
+            self._cache_weights = weights
+
+        if isinstance(path, np.ndarray):
+            path = path.astype(np.int64, copy=False)
+            key = path.tobytes()
+        else:
+            key = path
+        cost = cache.get(key)
+        if cost is not None:
+            return cost
+
+        cost = self.calculate_weighted_cost(
+            path, delay_w, reliability_w, resource_w, bw_demand
         )
+        cache[key] = cost
+        # dict ekleme sırasını korur: ilk anahtar en eski kayıttır
+        if len(cache) > COST_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        return cost
 
     def calculate_all(
         self, path: List[int], 
@@ -74,60 +437,37 @@ class MetricsService:
             delay_w, reliability_w, resource_w: Metrik ağırlıkları (toplam=1)
         
         Returns:
-            PathMetrics: Tüm metrikleri içeren veri objesi
+            PathMetrics: Tüm metrikleri içeren değişmez veri objesi
+            (önbellekten paylaşılabilir)
         """
-        # Geçersiz yol kontrolü
-        if not path or len(path) < 2:
+        key = (tuple(path) if path is not None else (), delay_w, reliability_w, resource_w)
+        cache = self._all_cache
+        metrics = cache.get(key)
+        if metrics is None:
+            metrics = self._calculate_all(path, delay_w, reliability_w, resource_w)
+            cache[key] = metrics
+            if len(cache) > COST_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        return metrics
+
+    def _calculate_all(
+        self, path: List[int],
+        delay_w: float, reliability_w: float, resource_w: float
+    ) -> PathMetrics:
+        """calculate_all'ın önbelleksiz gövdesi."""
+        raw = self._raw_metrics(path)
+        if raw is None:
             return PathMetrics(0.0, 0.0, 0.0, float('inf'), 0.0, 0.0)
+        total_delay, reliability_cost, raw_resource, min_bw = raw
 
-        # Değişken başlatma
-        total_delay = 0.0
-        total_reliability = 1.0
-        reliability_cost = 0.0
-        min_bw = float('inf')
-        
-        source, destination = path[0], path[-1]
-        
-        # === DÜĞÜM METRİKLERİ ===
-        for node in path:
-            # ProcessingDelay: Sadece ARA düğümler (S,D hariç)
-            if node != source and node != destination:
-                pd = self.graph.nodes[node].get('processing_delay', 0.0)
-                total_delay += float(pd)
-            
-            # NodeReliability: TÜM düğümler
-            nr = float(self.graph.nodes[node].get('reliability', 1.0))
-            total_reliability *= nr
-            reliability_cost += -math.log(max(nr, 0.001))
-
-        # === KENAR METRİKLERİ ===
-        for u, v in zip(path[:-1], path[1:]):
-            if not self.graph.has_edge(u, v):
-                return PathMetrics(0.0, 0.0, 0.0, float('inf'), 0.0, 0.0)
-            
-            edge = self.graph.edges[u, v]
-            
-            # Link Delay
-            total_delay += float(edge.get('delay', 0.0))
-            
-            # Link Reliability
-            ereliability = float(edge.get('reliability', 1.0))
-            total_reliability *= ereliability
-            reliability_cost += -math.log(max(ereliability, 0.001))
-            
-            # Bandwidth (darboğaz)
-            min_bw = min(min_bw, float(edge.get('bandwidth', 1000.0)))
+        # Çarpımsal güvenilirlik (sadece gösterim): Π r = exp(-Σ -log r)
+        total_reliability = math.exp(-reliability_cost)
 
         # === NORMALİZASYON ===
         norm_delay = min(total_delay / NormConfig.MAX_DELAY_MS, 1.0)
         norm_rel = min(reliability_cost / NormConfig.MAX_RELIABILITY_COST, 1.0)
         
         # Kaynak maliyeti: OSPF benzeri (Cost = 1Gbps / BW)
-        raw_resource = sum(
-            1000.0 / max(float(self.graph.edges[u, v].get('bandwidth', 1000.0)), 1.0)
-            for u, v in zip(path[:-1], path[1:])
-            if self.graph.has_edge(u, v)
-        )
         norm_resource = min(raw_resource / 200.0, 1.0)
 
         # Ağırlıklı toplam
@@ -160,16 +500,118 @@ class MetricsService:
         Returns:
             float: Maliyet (0-1) veya inf (geçersiz/kısıt ihlali)
         """
-        if not path or len(path) < 2:
+        # Bandwidth sert kısıtı çekirdekte: ihlal eden ilk kenarda erken çıkış
+        raw = self._raw_metrics(path, float(bw_demand))
+        if raw is None:
             return float('inf')
-            
-        metrics = self.calculate_all(path, delay_w, reliability_w, resource_w)
+        total_delay, reliability_cost, raw_resource, min_bw = raw
         
-        # Bandwidth sert kısıt kontrolü
-        if bw_demand > 0 and metrics.min_bandwidth < bw_demand:
-            return float('inf')
-            
-        return metrics.weighted_cost
+        # Sadece skaler maliyet gerekir: PathMetrics ve exp() atlanır;
+        # sıfır ağırlıklı terimlerin normalizasyonu da hesaplanmaz
+        cost = 0.0
+        if delay_w:
+            cost += delay_w * min(total_delay / NormConfig.MAX_DELAY_MS, 1.0)
+        if reliability_w:
+            cost += reliability_w * min(reliability_cost / NormConfig.MAX_RELIABILITY_COST, 1.0)
+        if resource_w:
+            cost += resource_w * min(raw_resource / 200.0, 1.0)
+        return cost
+
+    def make_cost_fn(
+        self, delay_w: float, reliability_w: float, resource_w: float,
+        bw_demand: float = 0.0
+    ) -> Callable[[List[int]], float]:
+        """
+        Sabit ağırlıklar için özelleşmiş maliyet fonksiyonu üretir.
+
+        Bir optimizasyon koşusunda ağırlıklar ve bant genişliği talebi
+        değişmez; çekirdek, diziler ve normalizasyon sabitleri kapanışa
+        yerel olarak bağlanır, her çağrıda öznitelik araması yapılmaz.
+        Sonuçlar calculate_weighted_cost ile aynıdır. invalidate()
+        sonrasında yeniden üretilmelidir.
+
+        Returns:
+            cost_fn(path) -> float (geçersiz/kısıt ihlali = inf)
+        """
+        kernel = _path_metrics_aot if _path_metrics_aot is not None else _path_metrics_jit
+        arrays = self._kernel_arrays
+        to_index = self._to_index
+        path_metrics_numpy = self._path_metrics_numpy
+        max_delay = NormConfig.MAX_DELAY_MS
+        max_reliability_cost = NormConfig.MAX_RELIABILITY_COST
+        inf = float('inf')
+        bw_demand = float(bw_demand)
+
+        def cost_fn(path) -> float:
+            if path is None or len(path) < 2:
+                return inf
+            p = to_index(path)
+            if kernel is not None:
+                valid, total_delay, reliability_cost, raw_resource, min_bw = kernel(p, bw_demand, *arrays)
+            else:
+                valid, total_delay, reliability_cost, raw_resource, min_bw = path_metrics_numpy(p, bw_demand)
+            if not valid:
+                return inf
+            cost = 0.0
+            if delay_w:
+                cost += delay_w * min(total_delay / max_delay, 1.0)
+            if reliability_w:
+                cost += reliability_w * min(reliability_cost / max_reliability_cost, 1.0)
+            if resource_w:
+                cost += resource_w * min(raw_resource / 200.0, 1.0)
+            return cost
+
+        return cost_fn
+
+    def calculate_weighted_cost_batch(
+        self, paths: List[List[int]],
+        delay_w: float, reliability_w: float, resource_w: float,
+        bw_demand: float = 0.0
+    ) -> np.ndarray:
+        """
+        Bir popülasyonun tamamı için ağırlıklı maliyet hesapla.
+
+        Yollar -1 ile dolgulu (P, L_max) matrise paketlenir ve tek çekirdek
+        çağrısıyla değerlendirilir. Sonuçlar calculate_weighted_cost ile aynıdır.
+
+        Returns:
+            np.ndarray: float64[P] maliyetler (geçersiz/kısıt ihlali = inf)
+
+        Raises:
+            IndexError: Bir yol grafta olmayan bir düğüm indeksi içeriyorsa
+            KeyError: Seyrek etiketli grafta bilinmeyen bir düğüm etiketi varsa
+            ValueError: Düğüm etiketleri tamsayı diziye çevrilemiyorsa
+        """
+        if _batch_costs_jit is None and _batch_costs_aot is None:
+            return np.array([
+                self.calculate_weighted_cost(path, delay_w, reliability_w, resource_w, bw_demand)
+                for path in paths
+            ], dtype=np.float64)
+
+        lengths = np.fromiter((len(path) for path in paths), dtype=np.int64, count=len(paths))
+        max_len = int(lengths.max()) if len(paths) else 0
+        padded = np.full((len(paths), max_len), -1, dtype=np.int64)
+        for i, path in enumerate(paths):
+            padded[i, :lengths[i]] = path if self._nidx is None else self._to_index(path)
+
+        # Graf dışı düğüm kontrolü çekirdek dışında (paralel bölgede istisna yok)
+        used = padded[padded >= 0]
+        if used.size != lengths[lengths > 0].sum() or (used.size and used.max() >= self._node_delay.shape[0]):
+            raise IndexError("Yol grafta olmayan bir düğüm içeriyor")
+
+        args = (padded, lengths, float(delay_w), float(reliability_w), float(resource_w),
+                float(bw_demand), NormConfig.MAX_DELAY_MS, NormConfig.MAX_RELIABILITY_COST,
+                *self._kernel_arrays)
+        if len(paths) >= BATCH_PARALLEL_MIN and _batch_costs_parallel_jit is not None:
+            try:
+                return _batch_costs_parallel_jit(*args)
+            except (NumbaError, ValueError):
+                # Paralel derleme başarısız (NumbaError) ya da iş parçacığı
+                # katmanı yüklenemedi (ValueError) → seri çekirdek
+                pass
+        if _batch_costs_aot is not None:
+            return _batch_costs_aot(*args)
+        return _batch_costs_jit(*args)
 
 
 __all__ = ["MetricsService", "PathMetrics", "NormConfig"]
@@ -52,16 +52,42 @@ KULLANIM ÖRNEĞİ:
 # KÜTÜPHANE İMPORTLARI
 # =============================================================================
 import os                 # Dosya sistemi işlemleri
+import importlib.util     # Opsiyonel kütüphane varlık kontrolü
+import sys                # Python sürümü (dataclass slots)
 import datetime           # Tarih/saat bilgisi
-from typing import Dict, List, Optional, Any  # Tip belirteçleri
+import copy               # Sabit paragraf kopyaları
+import functools          # Font kaydı önbelleği
+import operator           # Karşılaştırma tablosu alan seçimi
+import tempfile           # Küçültülmüş görüntü dosyaları
+import atexit             # Süreç havuzunu kapatma, geçici dosya temizliği
+import threading          # Havuz oluşturma kilidi
+import multiprocessing    # Süreç başlatma bağlamı (spawn)
+from concurrent.futures import Future, ProcessPoolExecutor  # Toplu / arka plan PDF üretimi
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Any, Tuple  # Tip belirteçleri
 from dataclasses import dataclass  # Veri sınıfları
 
 
 # =============================================================================
 # PDF OLUŞTURMA KÜTÜPHANESİ (reportlab)
 # =============================================================================
-# reportlab yüklü değilse PDF oluşturma devre dışı kalır
-try:
+# reportlab yüklü değilse PDF oluşturma devre dışı kalır. Varlık kontrolü
+# find_spec ile yapılır (içe aktarma yok); alt modüller ilk ReportService
+# oluşturulurken _load_reportlab() ile yüklenir.
+REPORTLAB_AVAILABLE = importlib.util.find_spec('reportlab') is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_reportlab() -> None:
+    """reportlab adlarını modül düzeyine ilk kullanımda bağlar."""
+    global colors, A4, getSampleStyleSheet, ParagraphStyle, cm, mm
+    global SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
+    global TA_CENTER, TA_LEFT, pdfmetrics, TTFont
+    # Öznitelik doğrulaması (graphics.shapes / widget'lar) yalnızca hata
+    # ayıklamada gerekli; shapes modülü değeri içe aktarılırken okuduğundan
+    # diğer reportlab importlarından önce kapatılır
+    from reportlab import rl_config
+    rl_config.shapeChecking = 0
     from reportlab.lib import colors                    # Renk tanımları
     from reportlab.lib.pagesizes import A4              # Sayfa boyutu
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle  # Stiller
@@ -70,80 +96,213 @@ try:
     from reportlab.lib.enums import TA_CENTER, TA_LEFT  # Hizalama
     from reportlab.pdfbase import pdfmetrics            # Font yönetimi
     from reportlab.pdfbase.ttfonts import TTFont        # TrueType font desteği
-    
-    REPORTLAB_AVAILABLE = True  # PDF oluşturma aktif
-    
-    # =========================================================================
-    # TÜRKÇE KARAKTER DESTEĞİ İÇİN FONT KAYDI
-    # =========================================================================
-    # DejaVu Sans: Türkçe karakterleri (ş, ğ, ü, ö, ı, ç) destekler
-    # Farklı işletim sistemlerinde farklı konumlarda bulunabilir
-    import sys
-    FONT_REGISTERED = False
-    FONT_NAME = 'DejaVu'           # Normal font
-    FONT_NAME_BOLD = 'DejaVu-Bold' # Kalın font
-    
-    # İşletim sistemine göre olası font yolları
-    font_paths = [
-        # Windows
-        'C:/Windows/Fonts/DejaVuSans.ttf',
-        'C:/Windows/Fonts/arial.ttf',
-        # Linux
-        '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
-        '/usr/share/fonts/TTF/DejaVuSans.ttf',
-        # macOS
-        '/Library/Fonts/Arial Unicode.ttf',
-    ]
-    font_bold_paths = [
-        'C:/Windows/Fonts/DejaVuSans-Bold.ttf',
-        'C:/Windows/Fonts/arialbd.ttf',
-        '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
-        '/usr/share/fonts/TTF/DejaVuSans-Bold.ttf',
-        '/Library/Fonts/Arial Unicode.ttf',
-    ]
-    
-    # Normal fontu kaydet
-    for font_path in font_paths:
-        if os.path.exists(font_path):
-            try:
-                pdfmetrics.registerFont(TTFont(FONT_NAME, font_path))
-                FONT_REGISTERED = True
-                break
-            except Exception:
-                continue
-    
-    # Kalın fontu kaydet
-    for font_path in font_bold_paths:
-        if os.path.exists(font_path):
+
+
+# =============================================================================
+# TÜRKÇE KARAKTER DESTEĞİ İÇİN FONT KAYDI
+# =============================================================================
+# DejaVu Sans: Türkçe karakterleri (ş, ğ, ü, ö, ı, ç) destekler
+# Farklı işletim sistemlerinde farklı konumlarda bulunabilir
+FONT_NAME = 'DejaVu'           # Normal font
+FONT_NAME_BOLD = 'DejaVu-Bold' # Kalın font
+
+# İşletim sistemine göre olası font yolları
+FONT_PATHS = (
+    # Windows
+    'C:/Windows/Fonts/DejaVuSans.ttf',
+    'C:/Windows/Fonts/arial.ttf',
+    # Linux
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    '/usr/share/fonts/TTF/DejaVuSans.ttf',
+    # macOS
+    '/Library/Fonts/Arial Unicode.ttf',
+)
+FONT_BOLD_PATHS = (
+    'C:/Windows/Fonts/DejaVuSans-Bold.ttf',
+    'C:/Windows/Fonts/arialbd.ttf',
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+    '/usr/share/fonts/TTF/DejaVuSans-Bold.ttf',
+    '/Library/Fonts/Arial Unicode.ttf',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _index_font_dir(directory: str) -> Dict[str, str]:
+    """
+    Font dizinini tek os.scandir ile listeler (dosya adı -> yol).
+
+    Aday başına bir stat yerine dizin başına bir listeleme yapılır;
+    normal ve kalın adaylar aynı dizinleri paylaştığından her dizin
+    süreç başına bir kez taranır. Dizin yoksa boş sözlük döner.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return {e.name: e.path for e in it if e.is_file()}
+    except OSError:
+        return {}
+
+
+@functools.lru_cache(maxsize=None)
+def _register_font(name: str, candidates: Tuple[str, ...]) -> bool:
+    """
+    Adayların ilk geçerli TTF dosyasını name adıyla kaydeder.
+
+    Font zaten kayıtlıysa (önceki içe aktarma / başka bir servis)
+    dosya sistemine hiç bakılmaz ve TTF yeniden ayrıştırılmaz.
+
+    Returns:
+        Font kullanılabilir mi
+    """
+    if name in pdfmetrics.getRegisteredFontNames():
+        return True
+    for font_path in candidates:
+        directory, filename = os.path.split(font_path)
+        if filename in _index_font_dir(directory):
             try:
-                pdfmetrics.registerFont(TTFont(FONT_NAME_BOLD, font_path))
-                break
+                pdfmetrics.registerFont(TTFont(name, font_path))
+                return True
             except Exception:
                 continue
-    
+    return False
+
+
+@functools.lru_cache(maxsize=1)
+def _register_fonts() -> Tuple[str, str]:
+    """
+    Fontları ilk ReportService oluşturulurken bir kez kaydeder.
+
+    Modül içe aktarımı dosya sistemine dokunmaz; sonraki çağrılar
+    önbellekten döner.
+
+    Returns:
+        (normal_font, kalin_font) adları; DejaVu bulunamazsa Helvetica
+        (Türkçe desteği yok)
+    """
+    if not REPORTLAB_AVAILABLE:
+        return 'Helvetica', 'Helvetica-Bold'
+    _load_reportlab()
+
     # Font bulunamazsa varsayılan kullan (Türkçe desteği yok)
-    if not FONT_REGISTERED:
-        FONT_NAME = 'Helvetica'
-        FONT_NAME_BOLD = 'Helvetica-Bold'
-        
-except ImportError:
-    # reportlab yüklü değil - PDF oluşturma devre dışı
-    REPORTLAB_AVAILABLE = False
-    FONT_NAME = 'Helvetica'
-    FONT_NAME_BOLD = 'Helvetica-Bold'
+    if not _register_font(FONT_NAME, FONT_PATHS):
+        return 'Helvetica', 'Helvetica-Bold'
+
+    # Kalın font yoksa normal font kullanılır (kayıtsız ad build'i bozar)
+    bold = FONT_NAME_BOLD if _register_font(FONT_NAME_BOLD, FONT_BOLD_PATHS) else FONT_NAME
+    return FONT_NAME, bold
 
 
 # =============================================================================
 # GÖRÜNTÜ İŞLEME KÜTÜPHANESİ (Pillow)
 # =============================================================================
-try:
-    from PIL import Image as PILImage
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# Yalnızca görüntü küçültülürken içe aktarılır (_prepare_image)
+PIL_AVAILABLE = importlib.util.find_spec('PIL') is not None
+
+# _prepare_image tarafından yazılan geçici dosyalar; süreç sonunda silinir
+_TEMP_IMAGES: List[str] = []
+
+
+@atexit.register
+def _cleanup_temp_images() -> None:
+    """Küçültülmüş geçici görüntü dosyalarını siler."""
+    while _TEMP_IMAGES:
+        try:
+            os.remove(_TEMP_IMAGES.pop())
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=None)
+def _build_table_styles(font_name: str, font_name_bold: str) -> Tuple[Any, Any, Any, Any]:
+    """
+    Rapor tablo stillerini font çifti başına bir kez kurar.
+
+    TableStyle komut listeleri ve HexColor ayrıştırmaları tüm
+    ReportService örnekleri (ve toplu üretim süreçlerindeki her rapor)
+    arasında paylaşılır.
+
+    Returns:
+        (info, weights, results, comparison) TableStyle nesneleri
+    """
+    # Genel bilgiler: sol sütun başlık
+    info = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f1f5f9')),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#334155')),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), font_name),
+        ('FONTNAME', (0, 0), (0, -1), font_name_bold),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+    ])
+    # Ağırlıklar: koyu başlık satırı
+    weights = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e293b')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, -1), font_name),
+        ('FONTNAME', (0, 0), (-1, 0), font_name_bold),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+    ])
+    # Sonuçlar: yeşil başlık satırı
+    results = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#22c55e')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, -1), font_name),
+        ('FONTNAME', (0, 0), (-1, 0), font_name_bold),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+    ])
+    # Karşılaştırma: koyu başlık + zebra satırlar
+    comparison = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e293b')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, -1), font_name),
+        ('FONTNAME', (0, 0), (-1, 0), font_name_bold),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8fafc')]),
+    ])
+    return info, weights, results, comparison
+
+
+# Gömülü görüntülerin hedef çözünürlüğü (çizim boyutu cm × DPI / 2.54)
+REPORT_IMAGE_DPI = 150
+
+
+def report_timestamp() -> str:
+    """Raporlara yazılan oluşturulma tarihi metni (GG.AA.YYYY SS:DD)."""
+    return datetime.datetime.now().strftime('%d.%m.%Y %H:%M')
+
+
+# Karşılaştırma tablosu: başlık, sütun alanları ve eksik alan varsayılanları
+_COMPARISON_HEADER = ["Algoritma", "Gecikme (ms)", "Güvenilirlik (%)", "Maliyet", "Süre (ms)"]
+_COMPARISON_FIELDS = operator.itemgetter(
+    'algorithm', 'total_delay', 'total_reliability', 'weighted_cost', 'computation_time_ms'
+)
+_COMPARISON_DEFAULTS = {
+    'algorithm': 'N/A',
+    'total_delay': 0,
+    'total_reliability': 0,
+    'weighted_cost': 0,
+    'computation_time_ms': 0,
+}
+
+
+# Örnek başına __dict__ oluşturulmaz (slots=True 3.10+; 3.9'da normal sınıf)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ReportData:
     """Rapor için gerekli veriler."""
     algorithm_name: str
@@ -168,11 +327,14 @@ class ReportService:
     
     def __init__(self):
         self.styles = None
-        self.font_name = FONT_NAME
-        self.font_name_bold = FONT_NAME_BOLD
+        self.font_name, self.font_name_bold = _register_fonts()
+        # (metin, stil adı) -> ayrıştırılmış sabit Paragraph şablonu
+        self._paragraph_cache: Dict[Tuple[str, str], Any] = {}
         if REPORTLAB_AVAILABLE:
+            _load_reportlab()
             self.styles = getSampleStyleSheet()
             self._setup_custom_styles()
+            self._setup_table_styles()
     
     def _setup_custom_styles(self):
         """Özel stil tanımlamaları."""
@@ -211,14 +373,295 @@ class ReportService:
             textColor=colors.HexColor('#475569')
         ))
     
+    def _setup_table_styles(self):
+        """Paylaşılan tablo stillerini bu örneğin fontlarıyla bağlar."""
+        (self._info_table_style, self._weights_table_style,
+         self._results_table_style, self._comparison_table_style) = _build_table_styles(
+            self.font_name, self.font_name_bold
+        )
+
+    def _prepare_image(
+        self,
+        path: str,
+        width_cm: float,
+        height_cm: float,
+        dpi: int = REPORT_IMAGE_DPI
+    ) -> str:
+        """
+        Büyük görüntüyü PDF'e gömmeden önce PIL ile küçültür.
+
+        reportlab görüntüyü tam çözünürlükte gömer; çizim boyutu
+        (width_cm × height_cm) için dpi çözünürlüğü yeterlidir. Saydamlık
+        yoksa JPEG (quality=85), varsa optimize PNG yazılır. Geçici
+        dosyalar rapor bittikten sonra (havuz işçisinde) ya da süreç
+        sonunda silinir. PIL yoksa veya görüntü zaten küçükse kaynak yol
+        döner.
+        """
+        if not PIL_AVAILABLE:
+            return path
+
+        target_px = (int(width_cm / 2.54 * dpi), int(height_cm / 2.54 * dpi))
+        try:
+            from PIL import Image as PILImage
+            with PILImage.open(path) as im:
+                if im.width <= target_px[0] and im.height <= target_px[1]:
+                    return path
+                im.thumbnail(target_px, PILImage.LANCZOS)
+                has_alpha = im.mode in ('RGBA', 'LA') or 'transparency' in im.info
+                suffix = '.png' if has_alpha else '.jpg'
+                with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+                    if has_alpha:
+                        im.save(tmp, 'PNG', optimize=True, compress_level=6)
+                    else:
+                        im.convert('RGB').save(tmp, 'JPEG', quality=85, optimize=True)
+        except Exception as e:
+            # Küçültme başarısızsa orijinal görüntü gömülür
+            print(f"Görüntü küçültülemedi: {e}")
+            return path
+
+        _TEMP_IMAGES.append(tmp.name)
+        return tmp.name
+
     def is_available(self) -> bool:
         """PDF oluşturma kütüphanesi mevcut mu?"""
         return REPORTLAB_AVAILABLE
     
+    def _build_document(self, output_path: str, story: List[Any]) -> None:
+        """
+        Flowable listesini A4 şablonuna dizer ve PDF'i yazar.
+
+        reportlab belgeyi bellekte tamamlayıp dosyaya tek write ile
+        yazar; ek tampon gerekmez. Dosya kapatılmadan fsync edilir: rapor
+        arka plan sürecinde üretildiğinden arayüz "kaydedildi" dediğinde
+        içerik diskte olmalıdır. Hata olursa yarım dosya silinir.
+        """
+        try:
+            with open(output_path, 'wb') as fh:
+                doc = SimpleDocTemplate(
+                    fh,
+                    pagesize=A4,
+                    rightMargin=2*cm,
+                    leftMargin=2*cm,
+                    topMargin=2*cm,
+                    bottomMargin=2*cm
+                )
+                doc.build(story)
+                fh.flush()
+                os.fsync(fh.fileno())
+        except Exception:
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+            raise
+
+    def _static_paragraph(self, text: str, style_name: str):
+        """
+        Sabit metinli (başlık, alt bilgi) Paragraph'ı önbellekten verir.
+
+        Biçimlendirme ayrıştırması (frag listesi) metin/stil başına bir
+        kez yapılır. platypus yerleşim sırasında flowable'a durum yazar
+        (_postponed, wrap sonuçları); bu yüzden şablonun kendisi değil
+        sığ kopyası döner.
+        """
+        key = (text, style_name)
+        para = self._paragraph_cache.get(key)
+        if para is None:
+            para = Paragraph(text, self.styles[style_name])
+            self._paragraph_cache[key] = para
+        return copy.copy(para)
+
+    def _header_flowables(self, title: str, timestamp: Optional[str] = None) -> List[Any]:
+        """Başlık ve oluşturulma tarihi (verilmezse şimdiki zaman)."""
+        story = []
+        story.append(self._static_paragraph(title, 'CustomTitle'))
+        story.append(Paragraph(
+            f"Oluşturulma Tarihi: {timestamp or report_timestamp()}",
+            self.styles['CustomBody']
+        ))
+        story.append(Spacer(1, 20))
+        return story
+
+    def _footer_flowables(self) -> List[Any]:
+        """Rapor alt bilgisi."""
+        story = []
+        story.append(Spacer(1, 30))
+        story.append(self._static_paragraph(
+            "Bu rapor QoS Routing Optimizer v2.4 tarafından otomatik oluşturulmuştur.",
+            'CustomBody'
+        ))
+        return story
+
+    def _image_flowables(
+        self,
+        title: str,
+        path: Optional[str],
+        width_cm: float,
+        height_cm: float,
+        label: str,
+        space_after: int = 0
+    ) -> List[Any]:
+        """Görüntü bölümü; dosya yoksa hiçbir şey, okunamazsa yalnızca başlık."""
+        story = []
+        if not path or not os.path.exists(path):
+            return story
+        story.append(self._static_paragraph(title, 'CustomHeading'))
+        try:
+            prepared = self._prepare_image(path, width_cm, height_cm)
+            img = Image(prepared)
+            img.drawWidth = width_cm*cm
+            img.drawHeight = height_cm*cm
+        except Exception as e:
+            print(f"{label} eklenemedi: {e}")
+            return story
+        story.append(img)
+        if space_after:
+            story.append(Spacer(1, space_after))
+        return story
+
+    def _report_story(self, report_data: ReportData, timestamp: Optional[str] = None) -> List[Any]:
+        """Tekil sonuç raporunun flowable listesi."""
+        story = []
+        story.extend(self._header_flowables("QoS Routing Optimizasyon Raporu", timestamp))
+        
+        # Genel Bilgiler
+        story.append(self._static_paragraph("Genel Bilgiler", 'CustomHeading'))
+        
+        info_data = [
+            ["Algoritma", report_data.algorithm_name],
+            ["Kaynak Düğüm", str(report_data.source)],
+            ["Hedef Düğüm", str(report_data.destination)],
+            ["Düğüm Sayısı", str(report_data.node_count)],
+            ["Kenar Sayısı", str(report_data.edge_count)],
+            ["Hesaplama Süresi", f"{report_data.computation_time_ms:.2f} ms"],
+            ["Seed (Reproducibility)", str(report_data.seed_used) if report_data.seed_used else "-"],
+        ]
+        
+        info_table = Table(info_data, colWidths=[6*cm, 8*cm])
+        info_table.setStyle(self._info_table_style)
+        story.append(info_table)
+        story.append(Spacer(1, 20))
+        
+        # Ağırlıklar
+        story.append(self._static_paragraph("Ağırlık Konfigürasyonu", 'CustomHeading'))
+        
+        weights_data = [
+            ["Metrik", "Ağırlık (%)"],
+            ["Gecikme (Delay)", f"{report_data.weights.get('delay', 0) * 100:.1f}%"],
+            ["Güvenilirlik (Reliability)", f"{report_data.weights.get('reliability', 0) * 100:.1f}%"],
+            ["Kaynak Kullanımı (Resource)", f"{report_data.weights.get('resource', 0) * 100:.1f}%"],
+        ]
+        
+        weights_table = Table(weights_data, colWidths=[7*cm, 7*cm])
+        weights_table.setStyle(self._weights_table_style)
+        story.append(weights_table)
+        story.append(Spacer(1, 20))
+        
+        # Sonuç Metrikleri
+        story.append(self._static_paragraph("Optimizasyon Sonuçları", 'CustomHeading'))
+        
+        results_data = [
+            ["Metrik", "Değer"],
+            ["Toplam Gecikme", f"{report_data.total_delay:.2f} ms"],
+            ["Toplam Güvenilirlik", f"{report_data.total_reliability * 100:.2f}%"],
+            ["Kaynak Maliyeti", f"{report_data.resource_cost:.4f}"],
+            ["Ağırlıklı Maliyet", f"{report_data.weighted_cost:.4f}"],
+            ["Yol Uzunluğu", f"{len(report_data.path)} düğüm"],
+        ]
+        
+        results_table = Table(results_data, colWidths=[7*cm, 7*cm])
+        results_table.setStyle(self._results_table_style)
+        story.append(results_table)
+        story.append(Spacer(1, 20))
+        
+        # Bulunan Yol
+        story.append(self._static_paragraph("Bulunan Yol", 'CustomHeading'))
+        
+        path_str = " → ".join(map(str, report_data.path))
+        story.append(Paragraph(
+            f"<font color='#1e293b'><b>{path_str}</b></font>",
+            self.styles['CustomBody']
+        ))
+        story.append(Spacer(1, 20))
+        
+        # Graf Görüntüsü (varsa)
+        story.extend(self._image_flowables(
+            "Graf Görselleştirmesi", report_data.graph_image_path, 14, 10, "Graf görüntüsü",
+            space_after=20
+        ))
+        
+        # Yakınsama Grafiği (varsa)
+        story.extend(self._image_flowables(
+            "Yakınsama Grafiği", report_data.convergence_image_path, 14, 8, "Yakınsama grafiği"
+        ))
+        
+        story.extend(self._footer_flowables())
+        return story
+
+    def _comparison_story(
+        self,
+        results: List[Dict],
+        source: int,
+        destination: int,
+        weights: Dict[str, float],
+        timestamp: Optional[str] = None
+    ) -> List[Any]:
+        """Karşılaştırma raporunun flowable listesi."""
+        story = []
+        story.extend(self._header_flowables("Algoritma Karşılaştırma Raporu", timestamp))
+        
+        # Test Bilgileri
+        story.append(self._static_paragraph("Test Parametreleri", 'CustomHeading'))
+        story.append(Paragraph(
+            f"Kaynak: {source} → Hedef: {destination}",
+            self.styles['CustomBody']
+        ))
+        story.append(Paragraph(
+            f"Ağırlıklar: Delay={weights.get('delay', 0):.2f}, "
+            f"Reliability={weights.get('reliability', 0):.2f}, "
+            f"Resource={weights.get('resource', 0):.2f}",
+            self.styles['CustomBody']
+        ))
+        story.append(Spacer(1, 20))
+        
+        # Karşılaştırma Tablosu
+        story.append(self._static_paragraph("Sonuç Karşılaştırması", 'CustomHeading'))
+        
+        # Tek geçiş: eksik alanlar varsayılanla doldurulur, satır itemgetter
+        # ile biçimlenir ve en düşük maliyetli sonuç aynı döngüde izlenir
+        # (weighted_cost'u olmayan sonuç en iyi sayılmaz)
+        table_data = [_COMPARISON_HEADER]
+        append = table_data.append
+        best, best_cost = None, float('inf')
+        for r in results:
+            alg, delay, rel, cost, ms = _COMPARISON_FIELDS({**_COMPARISON_DEFAULTS, **r})
+            append([alg, f"{delay:.2f}", f"{rel * 100:.2f}", f"{cost:.4f}", f"{ms:.2f}"])
+            if cost < best_cost and 'weighted_cost' in r:
+                best, best_cost = r, cost
+        if best is None:
+            # min() ile aynı: hiçbirinde maliyet yoksa ilk sonuç
+            best = results[0]
+        
+        comparison_table = Table(table_data, colWidths=[3.5*cm, 3*cm, 3.5*cm, 2.5*cm, 2.5*cm])
+        comparison_table.setStyle(self._comparison_table_style)
+        story.append(comparison_table)
+        story.append(Spacer(1, 20))
+        
+        # En iyi algoritma
+        story.append(Paragraph(
+            f"<b>En İyi Sonuç:</b> {best.get('algorithm', 'N/A')} "
+            f"(Maliyet: {best.get('weighted_cost', 0):.4f})",
+            self.styles['CustomBody']
+        ))
+        
+        story.extend(self._footer_flowables())
+        return story
+
     def generate_pdf_report(
         self,
         report_data: ReportData,
-        output_path: str
+        output_path: str,
+        timestamp: Optional[str] = None
     ) -> bool:
         """
         PDF rapor oluşturur.
@@ -226,6 +669,8 @@ class ReportService:
         Args:
             report_data: Rapor verileri
             output_path: Çıktı dosya yolu
+            timestamp: Oluşturulma tarihi metni (None ise şimdiki zaman);
+                toplu üretimde tüm raporlara aynı değer verilir
             
         Returns:
             Başarılı ise True
@@ -234,153 +679,7 @@ class ReportService:
             raise ImportError("reportlab kütüphanesi yüklü değil. 'pip install reportlab' ile yükleyin.")
         
         try:
-            doc = SimpleDocTemplate(
-                output_path,
-                pagesize=A4,
-                rightMargin=2*cm,
-                leftMargin=2*cm,
-                topMargin=2*cm,
-                bottomMargin=2*cm
-            )
-            
-            story = []
-            
-            # Başlık
-            story.append(Paragraph(
-                "QoS Routing Optimizasyon Raporu",
-                self.styles['CustomTitle']
-            ))
-            
-            # Tarih
-            now = datetime.datetime.now()
-            story.append(Paragraph(
-                f"Oluşturulma Tarihi: {now.strftime('%d.%m.%Y %H:%M')}",
-                self.styles['CustomBody']
-            ))
-            story.append(Spacer(1, 20))
-            
-            # Genel Bilgiler
-            story.append(Paragraph("Genel Bilgiler", self.styles['CustomHeading']))
-            
-            info_data = [
-                ["Algoritma", report_data.algorithm_name],
-                ["Kaynak Düğüm", str(report_data.source)],
-                ["Hedef Düğüm", str(report_data.destination)],
-                ["Düğüm Sayısı", str(report_data.node_count)],
-                ["Kenar Sayısı", str(report_data.edge_count)],
-                ["Hesaplama Süresi", f"{report_data.computation_time_ms:.2f} ms"],
-                ["Seed (Reproducibility)", str(report_data.seed_used) if report_data.seed_used else "-"],
-            ]
-            
-            info_table = Table(info_data, colWidths=[6*cm, 8*cm])
-            info_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f1f5f9')),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#334155')),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), self.font_name),
-                ('FONTNAME', (0, 0), (0, -1), self.font_name_bold),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-            ]))
-            story.append(info_table)
-            story.append(Spacer(1, 20))
-            
-            # Ağırlıklar
-            story.append(Paragraph("Ağırlık Konfigürasyonu", self.styles['CustomHeading']))
-            
-            weights_data = [
-                ["Metrik", "Ağırlık (%)"],
-                ["Gecikme (Delay)", f"{report_data.weights.get('delay', 0) * 100:.1f}%"],
-                ["Güvenilirlik (Reliability)", f"{report_data.weights.get('reliability', 0) * 100:.1f}%"],
-                ["Kaynak Kullanımı (Resource)", f"{report_data.weights.get('resource', 0) * 100:.1f}%"],
-            ]
-            
-            weights_table = Table(weights_data, colWidths=[7*cm, 7*cm])
-            weights_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e293b')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, -1), self.font_name),
-                ('FONTNAME', (0, 0), (-1, 0), self.font_name_bold),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-            ]))
-            story.append(weights_table)
-            story.append(Spacer(1, 20))
-            
-            # Sonuç Metrikleri
-            story.append(Paragraph("Optimizasyon Sonuçları", self.styles['CustomHeading']))
-            
-            results_data = [
-                ["Metrik", "Değer"],
-                ["Toplam Gecikme", f"{report_data.total_delay:.2f} ms"],
-                ["Toplam Güvenilirlik", f"{report_data.total_reliability * 100:.2f}%"],
-                ["Kaynak Maliyeti", f"{report_data.resource_cost:.4f}"],
-                ["Ağırlıklı Maliyet", f"{report_data.weighted_cost:.4f}"],
-                ["Yol Uzunluğu", f"{len(report_data.path)} düğüm"],
-            ]
-            
-            results_table = Table(results_data, colWidths=[7*cm, 7*cm])
-            results_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#22c55e')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, -1), self.font_name),
-                ('FONTNAME', (0, 0), (-1, 0), self.font_name_bold),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-            ]))
-            story.append(results_table)
-            story.append(Spacer(1, 20))
-            
-            # Bulunan Yol
-            story.append(Paragraph("Bulunan Yol", self.styles['CustomHeading']))
-            
-            path_str = " → ".join(map(str, report_data.path))
-            story.append(Paragraph(
-                f"<font color='#1e293b'><b>{path_str}</b></font>",
-                self.styles['CustomBody']
-            ))
-            story.append(Spacer(1, 20))
-            
-            # Graf Görüntüsü (varsa)
-            if report_data.graph_image_path and os.path.exists(report_data.graph_image_path):
-                story.append(Paragraph("Graf Görselleştirmesi", self.styles['CustomHeading']))
-                try:
-                    img = Image(report_data.graph_image_path)
-                    img.drawWidth = 14*cm
-                    img.drawHeight = 10*cm
-                    story.append(img)
-                    story.append(Spacer(1, 20))
-                except Exception as e:
-                    print(f"Graf görüntüsü eklenemedi: {e}")
-            
-            # Yakınsama Grafiği (varsa)
-            if report_data.convergence_image_path and os.path.exists(report_data.convergence_image_path):
-                story.append(Paragraph("Yakınsama Grafiği", self.styles['CustomHeading']))
-                try:
-                    img = Image(report_data.convergence_image_path)
-                    img.drawWidth = 14*cm
-                    img.drawHeight = 8*cm
-                    story.append(img)
-                except Exception as e:
-                    print(f"Yakınsama grafiği eklenemedi: {e}")
-            
-            # Footer
-            story.append(Spacer(1, 30))
-            story.append(Paragraph(
-                "Bu rapor QoS Routing Optimizer v2.4 tarafından otomatik oluşturulmuştur.",
-                self.styles['CustomBody']
-            ))
-            
-            # PDF oluştur
-            doc.build(story)
+            self._build_document(output_path, self._report_story(report_data, timestamp))
             return True
             
         except Exception as e:
@@ -393,7 +692,8 @@ class ReportService:
         output_path: str,
         source: int,
         destination: int,
-        weights: Dict[str, float]
+        weights: Dict[str, float],
+        timestamp: Optional[str] = None
     ) -> bool:
         """
         Algoritma karşılaştırma raporu oluşturur.
@@ -404,6 +704,7 @@ class ReportService:
             source: Kaynak düğüm
             destination: Hedef düğüm
             weights: Ağırlıklar
+            timestamp: Oluşturulma tarihi metni (None ise şimdiki zaman)
             
         Returns:
             Başarılı ise True
@@ -412,93 +713,10 @@ class ReportService:
             raise ImportError("reportlab kütüphanesi yüklü değil.")
         
         try:
-            doc = SimpleDocTemplate(
+            self._build_document(
                 output_path,
-                pagesize=A4,
-                rightMargin=2*cm,
-                leftMargin=2*cm,
-                topMargin=2*cm,
-                bottomMargin=2*cm
+                self._comparison_story(results, source, destination, weights, timestamp)
             )
-            
-            story = []
-            
-            # Başlık
-            story.append(Paragraph(
-                "Algoritma Karşılaştırma Raporu",
-                self.styles['CustomTitle']
-            ))
-            
-            # Tarih
-            now = datetime.datetime.now()
-            story.append(Paragraph(
-                f"Oluşturulma Tarihi: {now.strftime('%d.%m.%Y %H:%M')}",
-                self.styles['CustomBody']
-            ))
-            story.append(Spacer(1, 20))
-            
-            # Test Bilgileri
-            story.append(Paragraph("Test Parametreleri", self.styles['CustomHeading']))
-            story.append(Paragraph(
-                f"Kaynak: {source} → Hedef: {destination}",
-                self.styles['CustomBody']
-            ))
-            story.append(Paragraph(
-                f"Ağırlıklar: Delay={weights.get('delay', 0):.2f}, "
-                f"Reliability={weights.get('reliability', 0):.2f}, "
-                f"Resource={weights.get('resource', 0):.2f}",
-                self.styles['CustomBody']
-            ))
-            story.append(Spacer(1, 20))
-            
-            # Karşılaştırma Tablosu
-            story.append(Paragraph("Sonuç Karşılaştırması", self.styles['CustomHeading']))
-            
-            table_data = [
-                ["Algoritma", "Gecikme (ms)", "Güvenilirlik (%)", "Maliyet", "Süre (ms)"]
-            ]
-            
-            for r in results:
-                table_data.append([
-                    r.get('algorithm', 'N/A'),
-                    f"{r.get('total_delay', 0):.2f}",
-                    f"{r.get('total_reliability', 0) * 100:.2f}",
-                    f"{r.get('weighted_cost', 0):.4f}",
-                    f"{r.get('computation_time_ms', 0):.2f}"
-                ])
-            
-            comparison_table = Table(table_data, colWidths=[3.5*cm, 3*cm, 3.5*cm, 2.5*cm, 2.5*cm])
-            comparison_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e293b')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, -1), self.font_name),
-                ('FONTNAME', (0, 0), (-1, 0), self.font_name_bold),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8fafc')]),
-            ]))
-            story.append(comparison_table)
-            story.append(Spacer(1, 20))
-            
-            # En iyi algoritma
-            best = min(results, key=lambda x: x.get('weighted_cost', float('inf')))
-            story.append(Paragraph(
-                f"<b>En İyi Sonuç:</b> {best.get('algorithm', 'N/A')} "
-                f"(Maliyet: {best.get('weighted_cost', 0):.4f})",
-                self.styles['CustomBody']
-            ))
-            
-            # Footer
-            story.append(Spacer(1, 30))
-            story.append(Paragraph(
-                "Bu rapor QoS Routing Optimizer v2.4 tarafından otomatik oluşturulmuştur.",
-                self.styles['CustomBody']
-            ))
-            
-            doc.build(story)
             return True
             
         except Exception as e:
@@ -517,4 +735,159 @@ def get_report_service() -> ReportService:
     return _report_service
 
 
-__all__ = ['ReportService', 'ReportData', 'get_report_service', 'REPORTLAB_AVAILABLE']
+# =============================================================================
+# TOPLU VE ARKA PLAN PDF ÜRETİMİ
+# =============================================================================
+# doc.build() CPU'ya bağlı (yerleşim, font işleme); raporlar ayrı
+# süreçlerde GIL'e takılmadan üretilir ve arayüz donmaz. Havuz çağrılar
+# arasında paylaşılır, her işte süreç başlatma maliyeti ödenmez.
+_report_executor: Optional[ProcessPoolExecutor] = None
+_report_executor_lock = threading.Lock()
+
+
+def _get_report_executor() -> ProcessPoolExecutor:
+    """Paylaşılan süreç havuzunu döndürür (ilk çağrıda oluşturur)."""
+    global _report_executor
+    with _report_executor_lock:
+        if _report_executor is None:
+            # Qt thread'lerinden güvenle çağrılabilmesi için 'spawn'
+            _report_executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(_shutdown_report_executor)
+        return _report_executor
+
+
+def _shutdown_report_executor() -> None:
+    global _report_executor
+    with _report_executor_lock:
+        if _report_executor is not None:
+            _report_executor.shutdown(wait=True)
+            _report_executor = None
+
+
+def _generate_pdf_report_worker(
+    report_data: ReportData,
+    output_path: str,
+    timestamp: Optional[str] = None
+) -> bool:
+    """Alt süreçte tek rapor üretir (süreç başına bir ReportService)."""
+    try:
+        return get_report_service().generate_pdf_report(report_data, output_path, timestamp)
+    finally:
+        # Havuz süreçleri os._exit ile kapanır, atexit çalışmaz
+        _cleanup_temp_images()
+
+
+def _generate_comparison_report_worker(
+    results: List[Dict],
+    output_path: str,
+    source: int,
+    destination: int,
+    weights: Dict[str, float],
+    timestamp: Optional[str] = None
+) -> bool:
+    """Alt süreçte karşılaştırma raporu üretir."""
+    return get_report_service().generate_comparison_report(
+        results, output_path, source, destination, weights, timestamp
+    )
+
+
+def _submit_report(fn, *args) -> Future:
+    """
+    Rapor üretimini paylaşılan süreç havuzuna gönderir.
+
+    Havuz kullanılamıyorsa rapor bu süreçte üretilir ve sonucu (veya
+    hatası) hazır bir Future içinde döner; çağıran taraf iki durumda da
+    aynı arayüzü kullanır.
+    """
+    if not REPORTLAB_AVAILABLE:
+        raise ImportError("reportlab kütüphanesi yüklü değil. 'pip install reportlab' ile yükleyin.")
+    try:
+        return _get_report_executor().submit(fn, *args)
+    except (OSError, RuntimeError, BrokenProcessPool):
+        _shutdown_report_executor()
+
+    future: Future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def generate_pdf_report_async(
+    report_data: ReportData,
+    output_path: str,
+    timestamp: Optional[str] = None
+) -> Future:
+    """
+    Tek PDF raporunu arka planda (ayrı süreçte) üretir.
+
+    reportlab'ın doc.build() süresi (yerleşim, font, deflate) Qt olay
+    döngüsünü bloklamaz. Dönen Future'ın sonucu generate_pdf_report ile
+    aynıdır; hata varsa result() onu yeniden fırlatır.
+    """
+    return _submit_report(_generate_pdf_report_worker, report_data, output_path, timestamp)
+
+
+def generate_comparison_report_async(
+    results: List[Dict],
+    output_path: str,
+    source: int,
+    destination: int,
+    weights: Dict[str, float],
+    timestamp: Optional[str] = None
+) -> Future:
+    """Karşılaştırma raporunu arka planda üretir (bkz. generate_pdf_report_async)."""
+    return _submit_report(
+        _generate_comparison_report_worker, results, output_path, source, destination, weights,
+        timestamp
+    )
+
+
+def generate_pdf_reports_batch(
+    datas: List[ReportData],
+    out_paths: List[str],
+    timestamp: Optional[str] = None
+) -> List[bool]:
+    """
+    Birden çok PDF raporunu paralel üretir.
+
+    Args:
+        datas: Rapor verileri (ReportData picklable dataclass)
+        out_paths: Her rapor için çıktı dosya yolu
+        timestamp: Tüm raporlara yazılacak oluşturulma tarihi; None ise
+            toplu iş başında bir kez alınır
+
+    Returns:
+        Rapor sırasıyla başarı bayrakları
+
+    Raises:
+        ValueError: Liste uzunlukları farklıysa
+        ImportError: reportlab yüklü değilse
+    """
+    if len(datas) != len(out_paths):
+        raise ValueError("datas ve out_paths aynı uzunlukta olmalı")
+    if not REPORTLAB_AVAILABLE:
+        raise ImportError("reportlab kütüphanesi yüklü değil. 'pip install reportlab' ile yükleyin.")
+
+    timestamp = timestamp or report_timestamp()
+    if len(datas) >= 2 and (os.cpu_count() or 1) >= 2:
+        try:
+            return list(_get_report_executor().map(
+                _generate_pdf_report_worker, datas, out_paths, [timestamp] * len(datas)
+            ))
+        except (OSError, BrokenProcessPool):
+            # Süreç havuzu kullanılamıyor: sıfırla ve seri üretime dön
+            _shutdown_report_executor()
+
+    service = get_report_service()
+    return [service.generate_pdf_report(data, path, timestamp) for data, path in zip(datas, out_paths)]
+
+
+__all__ = ['ReportService', 'ReportData', 'get_report_service', 'generate_pdf_reports_batch',
+           'report_timestamp',
+           'generate_pdf_report_async', 'generate_comparison_report_async',
+           'REPORTLAB_AVAILABLE']
@@ -3,18 +3,297 @@ Kontrol Paneli Widget - Graf ve optimizasyon ayarları
 """
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, 
-    QSpinBox, QDoubleSpinBox, QComboBox, QPushButton, QSlider,
-    QProgressBar, QFrame, QGridLayout, QSpacerItem, QSizePolicy, QLineEdit,
-    QScrollArea
+    QSpinBox, QComboBox, QPushButton, QSlider,
+    QProgressBar, QFrame, QGridLayout, QLineEdit,
+    QScrollArea, QButtonGroup, QApplication
 )
-from PyQt5.QtCore import pyqtSignal, Qt, QSize
-from PyQt5.QtGui import QColor, QPalette, QIcon
-from typing import Dict, List, Tuple
-from typing import Dict, List, Tuple
+from PyQt5.QtCore import pyqtSignal, Qt, QSize, QTimer, QSignalBlocker
+from PyQt5.QtGui import QIcon, QPixmap, QPainter
+from PyQt5.QtSvg import QSvgRenderer
+from typing import Dict, FrozenSet, List, Optional, Tuple
+import functools
 import os
 from .hyperparameter_dialog import HyperparameterDialog
 
 
+_ICONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "icons")
+
+
+@functools.lru_cache(maxsize=1)
+def _available_icons() -> FrozenSet[str]:
+    """İkon dizinindeki dosya adları (tek os.scandir; ikon başına stat yok)."""
+    try:
+        with os.scandir(_ICONS_DIR) as it:
+            return frozenset(e.name for e in it if e.is_file())
+    except OSError:
+        return frozenset()
+
+
+# (dosya adı, boyut) -> QIcon; SVG her panel kurulumunda yeniden işlenmez.
+# QIcon QApplication gerektirdiğinden ilk kullanımda oluşturulur.
+_ICON_CACHE: Dict[Tuple[str, int], QIcon] = {}
+
+
+def _render_svg_pixmap(path: str, size: int) -> Optional[QPixmap]:
+    """SVG'yi verilen boyutta (ekran ölçeğiyle) bir kez rasterleştirir."""
+    renderer = QSvgRenderer(path)
+    if not renderer.isValid():
+        return None
+    app = QApplication.instance()
+    ratio = app.devicePixelRatio() if app is not None else 1.0
+    pixmap = QPixmap(int(size * ratio), int(size * ratio))
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    renderer.render(painter)
+    painter.end()
+    pixmap.setDevicePixelRatio(ratio)
+    return pixmap
+
+
+def _get_icon(icon_file: str, size: int = 18) -> QIcon:
+    """
+    İkon dizinindeki dosya için paylaşılan QIcon'u döndürür.
+
+    SVG ikonlar size x size boyutunda önceden rasterleştirilir; böylece
+    buton her boyandığında SVG yeniden çizilmez. Buton ikon boyutu aynı
+    size değerine ayarlanmalıdır.
+    """
+    key = (icon_file, size)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        path = os.path.join(_ICONS_DIR, icon_file)
+        pixmap = _render_svg_pixmap(path, size) if icon_file.endswith(".svg") else None
+        icon = QIcon(pixmap) if pixmap is not None else QIcon(path)
+        _ICON_CACHE[key] = icon
+    return icon
+
+
+# Panelin tüm stil kuralları tek bir QSS'te toplanır ve kök widget'a bir kez
+# uygulanır (widget başına setStyleSheet + polish yerine tek ayrıştırma).
+# Kurallar nesne adlarıyla (#ad) sınırlandırılır; böylece ebeveyni panel
+# olan HyperparameterDialog gibi pencerelere sızmaz. Aynı görünümü paylaşan
+# widget'lar aynı nesne adını taşır.
+
+# Renkli butonlar ve slider'lar: nesne adı -> vurgu rengi
+_BUTTON_COLORS = {
+    "btnLoadCsv": "#10b981",   # Yeşil
+    "btnGenerate": "#2563eb",
+    "btnOptimize": "#a855f7",
+    "btnCompare": "#ec4899",
+}
+
+_SLIDER_COLORS = {
+    "sliderProb": "#3b82f6",
+    "sliderDelay": "#3b82f6",
+    "sliderRel": "#22c55e",
+    "sliderRes": "#f59e0b",
+}
+
+
+def _button_style(name: str, color: str) -> str:
+    return f"""
+    QPushButton#{name} {{
+        background-color: {color};
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-weight: 600;
+        font-size: 14px;
+        letter-spacing: 0.5px;
+    }}
+    QPushButton#{name}:hover {{
+        background-color: {color}dd;
+    }}
+    QPushButton#{name}:pressed {{
+        background-color: {color}aa;
+    }}
+    QPushButton#{name}:disabled {{
+        background-color: #334155;
+        color: #64748b;
+    }}
+"""
+
+
+def _slider_style(name: str, color: str) -> str:
+    return f"""
+    QSlider#{name}::groove:horizontal {{
+        border: none;
+        height: 4px;
+        background: #334155;
+        margin: 0;
+        border-radius: 2px;
+    }}
+    QSlider#{name}::handle:horizontal {{
+        background: {color};
+        border: 2px solid #0f172a;
+        width: 16px;
+        height: 16px;
+        margin: -6px 0;
+        border-radius: 8px;
+    }}
+    QSlider#{name}::sub-page:horizontal {{
+        background: {color};
+        border-radius: 2px;
+    }}
+"""
+
+
+_BASE_QSS = """
+    QWidget#ControlPanel {
+        background-color: rgba(15, 23, 42, 0.90); /* Slate-900 with 90% opacity */
+        border-radius: 12px;
+        border: 1px solid rgba(255, 255, 255, 0.1);
+    }
+
+    QScrollArea#panelScroll {
+        background: transparent;
+        border: none;
+    }
+    #panelScroll QScrollBar:vertical {
+        border: none;
+        background: #0f172a;
+        width: 6px;
+        margin: 0;
+        border-radius: 3px;
+    }
+    #panelScroll QScrollBar::handle:vertical {
+        background: #475569;
+        min-height: 30px;
+        border-radius: 3px;
+    }
+    #panelScroll QScrollBar::handle:vertical:hover {
+        background: #64748b;
+    }
+    #panelScroll QScrollBar::add-line:vertical, #panelScroll QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    #panelScroll QScrollBar::add-page:vertical, #panelScroll QScrollBar::sub-page:vertical {
+        background: none;
+    }
+
+    #content_widget { background: transparent; }
+
+    QGroupBox#panelGroup {
+        border: 1px solid #1e293b;
+        border-radius: 12px;
+        background-color: #111827; /* Darker background */
+    }
+
+    QLabel#headerLabel {
+        font-family: 'Segoe UI', sans-serif;
+        font-weight: bold;
+        font-size: 15px;
+        color: #f1f5f9;
+        padding-bottom: 8px;
+        border-bottom: 1px solid #1e293b;
+        margin-bottom: 8px;
+    }
+    QLabel#fieldLabel { color: #94a3b8; font-weight: 500; }
+    QLabel#smallFieldLabel { color: #94a3b8; font-weight: 500; font-size: 11px; }
+    QLabel#hintLabel { color: #64748b; font-size: 11px; }
+    QLabel#valueLabel { color: #e2e8f0; font-weight: bold; }
+    QLabel#arrowLabel { color: #64748b; font-size: 20px; font-weight: bold; margin-top: 15px; }
+    QLabel#demandLabel { color: #fbbf24; font-weight: bold; }
+    QLabel#weightName { color: #64748b; font-size: 14px; font-weight: 500; }
+    QLabel#weightValue { color: #e2e8f0; font-size: 14px; font-weight: bold; }
+
+    QFrame#separator { background-color: #334155; max-height: 1px; }
+
+    QSpinBox#panelInput {
+        background-color: #1f293b; 
+        color: #f8fafc;
+        border: 1px solid #334155;
+        border-radius: 6px;
+        padding: 0 10px;
+        font-size: 14px;
+        font-weight: 500;
+    }
+    QSpinBox#panelInput:focus {
+        border: 1px solid #3b82f6;
+        background-color: #1e293b;
+    }
+    QSpinBox#panelInput::up-button, QSpinBox#panelInput::down-button {
+        width: 0;
+        height: 0;
+    }
+
+    QLineEdit#algoSeedInput {
+        background-color: #1f293b; 
+        color: #f8fafc;
+        border: 1px solid #334155;
+        border-radius: 6px;
+        padding: 0 8px;
+        font-size: 13px;
+    }
+    QLineEdit#algoSeedInput:focus {
+        border: 1px solid #3b82f6;
+    }
+
+    QPushButton#btnSettings {
+        background-color: transparent;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton#btnSettings:hover {
+        background-color: #334155;
+    }
+
+    QPushButton#algoButton {
+        background-color: transparent;
+        color: #94a3b8;
+        border: 1px solid #334155;
+        border-radius: 8px;
+        font-size: 14px;
+        font-weight: 500;
+        text-align: left;
+        padding-left: 8px;
+    }
+    QPushButton#algoButton:hover {
+        border-color: #475569;
+        color: #e2e8f0;
+        background-color: #1e293b;
+    }
+    QPushButton#algoButton:checked {
+        background-color: #a855f7;
+        border-color: #a855f7;
+        color: white;
+        font-weight: 600;
+    }
+
+    QProgressBar#panelProgress {
+        border: none;
+        background-color: #334155;
+        border-radius: 2px;
+    }
+    QProgressBar#panelProgress::chunk {
+        background-color: #3b82f6; 
+        border-radius: 2px;
+    }
+
+    QPushButton#btnReset {
+        color: #ef4444; 
+        font-weight: bold;
+        border: 1px solid #ef4444;
+        border-radius: 8px;
+        padding: 10px 12px;
+        background-color: transparent;
+    }
+    QPushButton#btnReset:hover {
+        background-color: rgba(239, 68, 68, 0.15);
+        border-color: #f87171;
+    }
+    QPushButton#btnReset:pressed {
+        background-color: rgba(239, 68, 68, 0.25);
+    }
+"""
+
+CONTROL_PANEL_QSS = "".join(
+    [_BASE_QSS]
+    + [_button_style(name, color) for name, color in _BUTTON_COLORS.items()]
+    + [_slider_style(name, color) for name, color in _SLIDER_COLORS.items()]
+)
+
+
 class ControlPanel(QWidget):
     """Kontrol paneli widget'ı."""
     
@@ -26,13 +305,46 @@ class ControlPanel(QWidget):
     reset_requested = pyqtSignal()
     demand_selected = pyqtSignal(int, int, int)  # source, dest, demand_mbps
     
+    # Algoritma butonları: (metin, anahtar, ikon); buton id'si = sıra
+    _ALGORITHMS = (
+        ("Genetic", "ga", "genetic.svg"),
+        ("Ant", "aco", "ant.svg"),
+        ("Particle", "pso", "particle.svg"),
+        ("Simulated", "sa", "simulated.svg"),
+        ("Q-Learning", "qlearning", "qlearning.svg"),
+    )
+    _ALGO_KEYS = tuple(key for _, key, _ in _ALGORITHMS)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         # Use minimum width instead of fixed to allow flexibility
         self.setMinimumWidth(260)
         self.setMaximumWidth(300)
         self._demands: List[Tuple[int, int, int]] = []
+        # (kaynak, hedef) -> talep; optimize sırasında O(1) arama
+        self._demand_map: Dict[Tuple[int, int], int] = {}
+        # Son set_demands girdisi; aynı liste gelirse combo yeniden kurulmaz
+        self._demands_key: Optional[Tuple[Tuple[int, int, int], ...]] = None
         self.hyperparameters = {} # Store hyperparameter overrides
+        # Normalize ağırlıklar; herhangi bir slider değişince geçersizlenir
+        self._cached_weights: Optional[Dict[str, float]] = None
+        # Etiketlerde gösterilen son yüzdeler (değişmediyse setText atlanır)
+        self._last_weight_pcts: Tuple[int, int, int] = (-1, -1, -1)
+        # Slider sürüklenirken her tick yerine bir kare (16 ms) sonra tek güncelleme
+        self._weight_timer = QTimer(self)
+        self._weight_timer.setSingleShot(True)
+        self._weight_timer.setInterval(16)
+        self._weight_timer.timeout.connect(self._apply_weight_update)
+        # Bağlantı olasılığı etiketi için aynı birleştirme
+        self._prob_timer = QTimer(self)
+        self._prob_timer.setSingleShot(True)
+        self._prob_timer.setInterval(16)
+        self._prob_timer.timeout.connect(self._apply_prob_label)
+        # İlerleme çubuğu yalnızca 120 ms'den uzun süren işlemlerde gösterilir;
+        # kısa işlemlerde belirsiz animasyon hiç başlamaz
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(120)
         self._setup_ui()
     
     def _setup_ui(self):
@@ -44,13 +356,6 @@ class ControlPanel(QWidget):
         
         # Semi-transparent background for panel legibility
         self.setAttribute(Qt.WA_StyledBackground, True)
-        self.setStyleSheet("""
-            QWidget#ControlPanel {
-                background-color: rgba(15, 23, 42, 0.90); /* Slate-900 with 90% opacity */
-                border-radius: 12px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
         self.setObjectName("ControlPanel")
         
         # Scroll Area
@@ -58,38 +363,11 @@ class ControlPanel(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #0f172a;
-                width: 6px;
-                margin: 0;
-                border-radius: 3px;
-            }
-            QScrollBar::handle:vertical {
-                background: #475569;
-                min-height: 30px;
-                border-radius: 3px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #64748b;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
+        scroll.setObjectName("panelScroll")
         
         # Content Widget
         content_widget = QWidget()
         content_widget.setObjectName("content_widget")
-        content_widget.setStyleSheet("#content_widget { background: transparent; }")
         
         # Content Layout
         layout = QVBoxLayout(content_widget)
@@ -98,7 +376,7 @@ class ControlPanel(QWidget):
         
         # === GRAF OLUŞTURMA ===
         graph_group = QGroupBox()
-        graph_group.setStyleSheet(self._group_style())
+        graph_group.setObjectName("panelGroup")
         graph_layout = QVBoxLayout(graph_group)
         graph_layout.setSpacing(0) 
         graph_layout.setContentsMargins(0, 0, 0, 0)
@@ -116,7 +394,7 @@ class ControlPanel(QWidget):
         self.btn_load_csv = QPushButton("📁 Proje Verisini Yükle (CSV)")
         self.btn_load_csv.setFixedHeight(34)
         self.btn_load_csv.setCursor(Qt.PointingHandCursor)
-        self.btn_load_csv.setStyleSheet(self._button_style("#10b981"))  # Yeşil
+        self.btn_load_csv.setObjectName("btnLoadCsv")
         self.btn_load_csv.clicked.connect(self._on_load_csv_clicked)
         self.btn_load_csv.setToolTip("Verilen CSV dosyalarından graf verisini yükler")
         content_layout.addWidget(self.btn_load_csv)
@@ -124,27 +402,27 @@ class ControlPanel(QWidget):
         # Ayırıcı
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
-        separator.setStyleSheet("background-color: #334155; max-height: 1px;")
+        separator.setObjectName("separator")
         content_layout.addWidget(separator)
         
         # Veya rastgele oluştur label
         random_label = QLabel("— veya Rastgele Oluştur —")
         random_label.setAlignment(Qt.AlignCenter)
-        random_label.setStyleSheet("color: #64748b; font-size: 11px;")
+        random_label.setObjectName("hintLabel")
         content_layout.addWidget(random_label)
 
         # Node sayısı
         node_layout = QVBoxLayout()
         node_layout.setSpacing(6)
         lbl_nodes = QLabel("Düğüm Sayısı (n)")
-        lbl_nodes.setStyleSheet("color: #94a3b8; font-weight: 500;")
+        lbl_nodes.setObjectName("fieldLabel")
         node_layout.addWidget(lbl_nodes)
         
         self.spin_nodes = QSpinBox()
         self.spin_nodes.setRange(10, 500)
         self.spin_nodes.setValue(250)
         self.spin_nodes.setFixedHeight(30) 
-        self.spin_nodes.setStyleSheet(self._input_style())
+        self.spin_nodes.setObjectName("panelInput")
         node_layout.addWidget(self.spin_nodes)
         content_layout.addLayout(node_layout)
         
@@ -153,11 +431,11 @@ class ControlPanel(QWidget):
         prob_layout.setSpacing(6)
         prob_header = QHBoxLayout()
         lbl_prob = QLabel("Bağlantı Olasılığı (p)")
-        lbl_prob.setStyleSheet("color: #94a3b8; font-weight: 500;")
+        lbl_prob.setObjectName("fieldLabel")
         prob_header.addWidget(lbl_prob)
         
         self.label_prob = QLabel("0.40")
-        self.label_prob.setStyleSheet("color: #e2e8f0; font-weight: bold;")
+        self.label_prob.setObjectName("valueLabel")
         prob_header.addWidget(self.label_prob, 0, Qt.AlignRight)
         prob_layout.addLayout(prob_header)
         
@@ -165,7 +443,7 @@ class ControlPanel(QWidget):
         self.slider_prob.setRange(1, 90)
         self.slider_prob.setValue(40)
         self.slider_prob.valueChanged.connect(self._on_prob_changed)
-        self.slider_prob.setStyleSheet(self._slider_style("#3b82f6"))
+        self.slider_prob.setObjectName("sliderProb")
         prob_layout.addWidget(self.slider_prob)
         content_layout.addLayout(prob_layout)
         
@@ -173,14 +451,14 @@ class ControlPanel(QWidget):
         seed_layout = QVBoxLayout()
         seed_layout.setSpacing(6)
         lbl_seed = QLabel("Seed (opsiyonel)")
-        lbl_seed.setStyleSheet("color: #94a3b8; font-weight: 500;")
+        lbl_seed.setObjectName("fieldLabel")
         seed_layout.addWidget(lbl_seed)
         
         self.spin_seed = QSpinBox()
         self.spin_seed.setRange(0, 99999)
         self.spin_seed.setValue(42)
         self.spin_seed.setFixedHeight(30) 
-        self.spin_seed.setStyleSheet(self._input_style())
+        self.spin_seed.setObjectName("panelInput")
         seed_layout.addWidget(self.spin_seed)
         content_layout.addLayout(seed_layout)
         
@@ -188,7 +466,7 @@ class ControlPanel(QWidget):
         self.btn_generate = QPushButton("Graf Oluştur")
         self.btn_generate.setFixedHeight(34) 
         self.btn_generate.setCursor(Qt.PointingHandCursor)
-        self.btn_generate.setStyleSheet(self._button_style("#2563eb"))
+        self.btn_generate.setObjectName("btnGenerate")
         self.btn_generate.clicked.connect(self._on_generate_clicked)
         # Add icon manually if needed or via text
         content_layout.addWidget(self.btn_generate)
@@ -197,8 +475,61 @@ class ControlPanel(QWidget):
         layout.addWidget(graph_group)
         
         # === OPTİMİZASYON ===
+        # Grup ilk graf oluşturulana / CSV yüklenene kadar kurulmaz; yeri
+        # boş bir kapsayıcıyla ayrılır (bkz. _build_optimization_group)
+        self._opt_built = False
+        self._opt_container = QWidget()
+        opt_container_layout = QVBoxLayout(self._opt_container)
+        opt_container_layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._opt_container)
+        
+        # Progress Bar (Hidden by default)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedHeight(4)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setObjectName("panelProgress")
+        self.progress_bar.setRange(0, 0)  # Indeterminate
+        self.progress_bar.hide()
+        self._progress_timer.timeout.connect(self.progress_bar.show)
+        layout.addWidget(self.progress_bar)
+
+        layout.addStretch()
+        
+        # Content Layout - Add stretch before reset button to push it down
+        # (Reset button will be moved outside scroll area below)
+        layout.addStretch()
+
+        scroll.setWidget(content_widget)
+        main_layout.addWidget(scroll, 1)  # Stretch factor 1 to fill available space
+        
+        # Reset Button - OUTSIDE scroll area so it's always visible
+        # This ensures the button is never cut off and always accessible
+        self.btn_reset = QPushButton("Projeyi Sıfırla")
+        self.btn_reset.setFlat(True)
+        self.btn_reset.setMinimumHeight(44)  # Minimum height to ensure full visibility
+        self.btn_reset.setFixedHeight(44)  # Fixed height for consistency
+        self.btn_reset.setCursor(Qt.PointingHandCursor)
+        self.btn_reset.setObjectName("btnReset")
+        self.btn_reset.clicked.connect(lambda: self.reset_requested.emit())
+        # Add button with no stretch factor and ensure it's at the bottom
+        main_layout.addWidget(self.btn_reset, 0, Qt.AlignBottom)  # Align to bottom, no stretch
+        
+        # Tüm panel stilleri tek seferde (nesne adı seçicileriyle)
+        self.setStyleSheet(CONTROL_PANEL_QSS)
+    
+    def _build_optimization_group(self):
+        """
+        Optimizasyon grubunu (kaynak/hedef, talepler, ağırlıklar, algoritma
+        butonları) ilk ihtiyaçta kurar.
+
+        Uygulama açılışında yalnızca graf oluşturma grubu kurulur. Grubun
+        widget'larına dokunan genel metotlar (set_node_range, set_loading,
+        set_demands...) önce _ensure_optimization_group() çağırır.
+        """
+        self._opt_built = True
+        
         opt_group = QGroupBox()
-        opt_group.setStyleSheet(self._group_style())
+        opt_group.setObjectName("panelGroup")
         opt_layout = QVBoxLayout(opt_group)
         opt_layout.setSpacing(0) 
         opt_layout.setContentsMargins(0, 0, 0, 0)
@@ -213,22 +544,13 @@ class ControlPanel(QWidget):
         self.btn_settings.setToolTip("Gelişmiş Algoritma Ayarları")
         
         # Load Gear Icon
-        icons_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "icons", "settings.svg")
-        if os.path.exists(icons_path):
-            self.btn_settings.setIcon(QIcon(icons_path))
+        if "settings.svg" in _available_icons():
+            self.btn_settings.setIcon(_get_icon("settings.svg", 16))
+            self.btn_settings.setIconSize(QSize(16, 16))
         else:
              self.btn_settings.setText("⚙️")
              
-        self.btn_settings.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #334155;
-            }
-        """)
+        self.btn_settings.setObjectName("btnSettings")
         self.btn_settings.clicked.connect(self._on_settings_clicked)
         opt_header_layout.addWidget(self.btn_settings)
         opt_header_layout.addStretch() # Push header to left, button is next to it? No, header returns widget.
@@ -261,20 +583,20 @@ class ControlPanel(QWidget):
         src_layout = QVBoxLayout()
         src_layout.setSpacing(4)
         lbl_src = QLabel("Kaynak (S)")
-        lbl_src.setStyleSheet("color: #94a3b8; font-weight: 500; font-size: 11px;")
+        lbl_src.setObjectName("smallFieldLabel")
         src_layout.addWidget(lbl_src)
         
         self.spin_source = QSpinBox()
         self.spin_source.setRange(0, 249)
         self.spin_source.setValue(2)
         self.spin_source.setFixedHeight(32) 
-        self.spin_source.setStyleSheet(self._input_style())
+        self.spin_source.setObjectName("panelInput")
         src_layout.addWidget(self.spin_source)
         sd_layout.addLayout(src_layout)
         
         # Swap Icon (Optional, visual only)
         lbl_arrow = QLabel("→")
-        lbl_arrow.setStyleSheet("color: #64748b; font-size: 20px; font-weight: bold; margin-top: 15px;")
+        lbl_arrow.setObjectName("arrowLabel")
         lbl_arrow.setAlignment(Qt.AlignCenter)
         sd_layout.addWidget(lbl_arrow)
         
@@ -282,14 +604,14 @@ class ControlPanel(QWidget):
         dest_layout = QVBoxLayout()
         dest_layout.setSpacing(4)
         lbl_dest = QLabel("Hedef (D)")
-        lbl_dest.setStyleSheet("color: #94a3b8; font-weight: 500; font-size: 11px;")
+        lbl_dest.setObjectName("smallFieldLabel")
         dest_layout.addWidget(lbl_dest)
         
         self.spin_dest = QSpinBox()
         self.spin_dest.setRange(0, 249)
         self.spin_dest.setValue(248)
         self.spin_dest.setFixedHeight(32) 
-        self.spin_dest.setStyleSheet(self._input_style())
+        self.spin_dest.setObjectName("panelInput")
         dest_layout.addWidget(self.spin_dest)
         sd_layout.addLayout(dest_layout)
         
@@ -299,12 +621,12 @@ class ControlPanel(QWidget):
         demand_layout = QVBoxLayout()
         demand_layout.setSpacing(6)
         self.label_demands = QLabel("📋 Talep Çiftleri:")
-        self.label_demands.setStyleSheet("color: #fbbf24; font-weight: bold;")
+        self.label_demands.setObjectName("demandLabel")
         demand_layout.addWidget(self.label_demands)
         
         self.combo_demands = QComboBox()
         self.combo_demands.setFixedHeight(30)
-        self.combo_demands.setStyleSheet(self._input_style())
+        self.combo_demands.setObjectName("panelInput")
         self.combo_demands.currentIndexChanged.connect(self._on_demand_selected)
         self.combo_demands.setToolTip("Verilen kaynak-hedef çiftlerinden birini seçin")
         demand_layout.addWidget(self.combo_demands)
@@ -318,10 +640,10 @@ class ControlPanel(QWidget):
         # Manuel seçim ayırıcı
         self.manual_separator = QFrame()
         self.manual_separator.setFrameShape(QFrame.HLine)
-        self.manual_separator.setStyleSheet("background-color: #334155; max-height: 1px;")
+        self.manual_separator.setObjectName("separator")
         self.manual_label = QLabel("— veya Manuel Seçim —")
         self.manual_label.setAlignment(Qt.AlignCenter)
-        self.manual_label.setStyleSheet("color: #64748b; font-size: 11px;")
+        self.manual_label.setObjectName("hintLabel")
         self.manual_separator.hide()
         self.manual_label.hide()
         opt_content_layout.addWidget(self.manual_separator)
@@ -329,64 +651,60 @@ class ControlPanel(QWidget):
         
         # Ağırlıklar
         lbl_weights = QLabel("Ağırlıklar (W)")
-        lbl_weights.setStyleSheet("color: #94a3b8; font-weight: 500;")
+        lbl_weights.setObjectName("fieldLabel")
         opt_content_layout.addWidget(lbl_weights)
         
         weights_layout = QVBoxLayout()
         weights_layout.setSpacing(10)
         
-        self.slider_delay, self.label_delay = self._create_weight_row("Gecikme", 33, "#3b82f6")
+        self.slider_delay, self.slider_delay_w, self.label_delay = self._create_weight_row("Gecikme", 33, "sliderDelay")
         weights_layout.addLayout(self.slider_delay)
         
-        self.slider_rel, self.label_rel = self._create_weight_row("Güvenilirlik", 33, "#22c55e")
+        self.slider_rel, self.slider_rel_w, self.label_rel = self._create_weight_row("Güvenilirlik", 33, "sliderRel")
         weights_layout.addLayout(self.slider_rel)
         
-        self.slider_res, self.label_res = self._create_weight_row("Kaynak", 34, "#f59e0b")
+        self.slider_res, self.slider_res_w, self.label_res = self._create_weight_row("Kaynak", 34, "sliderRes")
         weights_layout.addLayout(self.slider_res)
         
         opt_content_layout.addLayout(weights_layout)
         
         # Algorithm selection
         lbl_algo = QLabel("Algoritma")
-        lbl_algo.setStyleSheet("color: #94a3b8; font-weight: 500;")
+        lbl_algo.setObjectName("fieldLabel")
         opt_content_layout.addWidget(lbl_algo)
         
-        self.algo_buttons = {}
+        self.algo_buttons: Dict[str, QPushButton] = {}
         algo_container = QWidget()
         algo_grid = QGridLayout(algo_container)
         algo_grid.setContentsMargins(0, 0, 0, 0)
         algo_grid.setVerticalSpacing(8) # Increased spacing
         algo_grid.setHorizontalSpacing(8)
         
-        algorithms = [
-            ("Genetic", "ga", "genetic.svg"), 
-            ("Ant", "aco", "ant.svg"),
-            ("Particle", "pso", "particle.svg"), 
-            ("Simulated", "sa", "simulated.svg"),
-            ("Q-Learning", "qlearning", "qlearning.svg")
-        ]
-        
-        icons_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "icons")
+        available_icons = _available_icons()
+
+        # Tekli seçim Qt tarafında (exclusive grup); buton id'si _ALGO_KEYS sırası
+        self._algo_group = QButtonGroup(self)
+        self._algo_group.setExclusive(True)
 
-        for i, (text, key, icon_file) in enumerate(algorithms):
+        for i, (text, key, icon_file) in enumerate(self._ALGORITHMS):
             btn = QPushButton(text)
             btn.setCheckable(True)
             btn.setFixedHeight(32) # Adequate height
             btn.setCursor(Qt.PointingHandCursor)
             
             # Load Icon
-            icon_path = os.path.join(icons_path, icon_file)
-            if os.path.exists(icon_path):
-                btn.setIcon(QIcon(icon_path))
+            if icon_file in available_icons:
+                btn.setIcon(_get_icon(icon_file, 18))
                 btn.setIconSize(QSize(18, 18))
             
-            btn.setStyleSheet(self._algo_button_style())
-            btn.clicked.connect(lambda checked, k=key: self._on_algo_selected(k))
+            btn.setObjectName("algoButton")
+            self._algo_group.addButton(btn, i)
             algo_grid.addWidget(btn, i // 2, i % 2) # Keep grid for now, but scroll makes it safe
             self.algo_buttons[key] = btn
             
         self.selected_algo = "sa"
         self.algo_buttons["sa"].setChecked(True)
+        self._algo_group.idClicked.connect(self._on_algo_id_clicked)
         
         opt_content_layout.addWidget(algo_container)
         
@@ -395,7 +713,7 @@ class ControlPanel(QWidget):
         multistart_layout.setSpacing(8)
         
         lbl_multistart = QLabel("Çoklu Çalıştırma:")
-        lbl_multistart.setStyleSheet("color: #94a3b8; font-weight: 500; font-size: 11px;")
+        lbl_multistart.setObjectName("smallFieldLabel")
         lbl_multistart.setToolTip("Algoritmayı N kez çalıştırıp en iyi sonucu döndürür")
         multistart_layout.addWidget(lbl_multistart)
         
@@ -404,12 +722,12 @@ class ControlPanel(QWidget):
         self.spin_multistart.setValue(1)  # Default: single run
         self.spin_multistart.setFixedHeight(26)
         self.spin_multistart.setFixedWidth(55)
-        self.spin_multistart.setStyleSheet(self._input_style())
+        self.spin_multistart.setObjectName("panelInput")
         self.spin_multistart.setToolTip("1 = Tek çalıştırma, 5+ = Multi-start (en iyi sonuç)")
         multistart_layout.addWidget(self.spin_multistart)
         
         lbl_runs = QLabel("çalıştırma")
-        lbl_runs.setStyleSheet("color: #64748b; font-size: 11px;")
+        lbl_runs.setObjectName("hintLabel")
         multistart_layout.addWidget(lbl_runs)
         
         multistart_layout.addStretch()
@@ -420,7 +738,7 @@ class ControlPanel(QWidget):
         seed_algo_layout.setSpacing(8)
         
         lbl_algo_seed = QLabel("Algoritma Seed:")
-        lbl_algo_seed.setStyleSheet("color: #94a3b8; font-weight: 500; font-size: 11px;")
+        lbl_algo_seed.setObjectName("smallFieldLabel")
         lbl_algo_seed.setToolTip("Tekrarlanabilirlik için seed değeri (boş = rastgele)")
         seed_algo_layout.addWidget(lbl_algo_seed)
         
@@ -428,19 +746,7 @@ class ControlPanel(QWidget):
         self.edit_algo_seed.setPlaceholderText("Rastgele")
         self.edit_algo_seed.setFixedHeight(26)
         self.edit_algo_seed.setFixedWidth(80)
-        self.edit_algo_seed.setStyleSheet("""
-            QLineEdit {
-                background-color: #1f293b; 
-                color: #f8fafc;
-                border: 1px solid #334155;
-                border-radius: 6px;
-                padding: 0 8px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #3b82f6;
-            }
-        """)
+        self.edit_algo_seed.setObjectName("algoSeedInput")
         self.edit_algo_seed.setToolTip("Boş bırakın = Rastgele seed, sayı girin = Sabit seed")
         seed_algo_layout.addWidget(self.edit_algo_seed)
         
@@ -451,7 +757,7 @@ class ControlPanel(QWidget):
         self.btn_optimize = QPushButton("Optimize Et")
         self.btn_optimize.setFixedHeight(34) 
         self.btn_optimize.setCursor(Qt.PointingHandCursor)
-        self.btn_optimize.setStyleSheet(self._button_style("#a855f7"))
+        self.btn_optimize.setObjectName("btnOptimize")
         self.btn_optimize.clicked.connect(self._on_optimize_clicked)
         opt_content_layout.addWidget(self.btn_optimize)
         
@@ -459,252 +765,122 @@ class ControlPanel(QWidget):
         self.btn_compare = QPushButton("Tüm Algoritmaları Karşılaştır")
         self.btn_compare.setFixedHeight(34) 
         self.btn_compare.setCursor(Qt.PointingHandCursor)
-        self.btn_compare.setStyleSheet(self._button_style("#ec4899"))
+        self.btn_compare.setObjectName("btnCompare")
         self.btn_compare.clicked.connect(self._on_compare_clicked)
         opt_content_layout.addWidget(self.btn_compare)
         
         opt_layout.addWidget(opt_content)
-        layout.addWidget(opt_group)
-        
-        # Progress Bar (Hidden by default)
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setFixedHeight(4)
-        self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                background-color: #334155;
-                border-radius: 2px;
-            }
-            QProgressBar::chunk {
-                background-color: #3b82f6; 
-                border-radius: 2px;
-            }
-        """)
-        self.progress_bar.hide()
-        layout.addWidget(self.progress_bar)
-
-        layout.addStretch()
-        
-        # Content Layout - Add stretch before reset button to push it down
-        # (Reset button will be moved outside scroll area below)
-        layout.addStretch()
-
-        scroll.setWidget(content_widget)
-        main_layout.addWidget(scroll, 1)  # Stretch factor 1 to fill available space
+        self._opt_container.layout().addWidget(opt_group)
         
-        # Reset Button - OUTSIDE scroll area so it's always visible
-        # This ensures the button is never cut off and always accessible
-        self.btn_reset = QPushButton("Projeyi Sıfırla")
-        self.btn_reset.setFlat(True)
-        self.btn_reset.setMinimumHeight(44)  # Minimum height to ensure full visibility
-        self.btn_reset.setFixedHeight(44)  # Fixed height for consistency
-        self.btn_reset.setCursor(Qt.PointingHandCursor)
-        self.btn_reset.setStyleSheet("""
-            QPushButton {
-                color: #ef4444; 
-                font-weight: bold;
-                border: 1px solid #ef4444;
-                border-radius: 8px;
-                padding: 10px 12px;
-                background-color: transparent;
-            }
-            QPushButton:hover {
-                background-color: rgba(239, 68, 68, 0.15);
-                border-color: #f87171;
-            }
-            QPushButton:pressed {
-                background-color: rgba(239, 68, 68, 0.25);
-            }
-        """)
-        self.btn_reset.clicked.connect(lambda: self.reset_requested.emit())
-        # Add button with no stretch factor and ensure it's at the bottom
-        main_layout.addWidget(self.btn_reset, 0, Qt.AlignBottom)  # Align to bottom, no stretch
+        # Yüzde etiketleri en geniş metne ("100%") göre bir kez boyutlanır;
+        # yazı tipi panel QSS'inden geldiği için önce stil uygulanır
+        for val_lbl in (self.label_delay, self.label_rel, self.label_res):
+            val_lbl.ensurePolished()
+            val_lbl.setFixedWidth(val_lbl.fontMetrics().horizontalAdvance("100%") + 4)
     
-    def _create_weight_row(self, label, val, color):
-        """Ağırlık satırı slider + label."""
+    def _ensure_optimization_group(self):
+        """Optimizasyon grubu henüz kurulmadıysa kur."""
+        if not self._opt_built:
+            self._build_optimization_group()
+    
+    def _create_weight_row(self, label, val, slider_name):
+        """Ağırlık satırı: (satır layout'u, slider, değer etiketi)."""
         row = QHBoxLayout()
         row.setSpacing(12)
         
         lbl = QLabel(label)
         lbl.setFixedWidth(70)
-        lbl.setStyleSheet("color: #64748b; font-size: 14px; font-weight: 500;")
+        lbl.setObjectName("weightName")
         row.addWidget(lbl)
         
         slider = QSlider(Qt.Horizontal)
         slider.setRange(0, 100)
         slider.setValue(val)
-        slider.setStyleSheet(self._slider_style(color))
+        slider.setObjectName(slider_name)
         slider.valueChanged.connect(self._on_weight_changed)
         row.addWidget(slider)
         
         val_lbl = QLabel(f"{val}%")
-        val_lbl.setFixedWidth(36)
+        val_lbl.setFixedWidth(36)  # Panele eklenince yazı tipine göre ayarlanır
         val_lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        val_lbl.setStyleSheet("color: #e2e8f0; font-size: 14px; font-weight: bold;")
+        val_lbl.setTextInteractionFlags(Qt.NoTextInteraction)
+        val_lbl.setAttribute(Qt.WA_TransparentForMouseEvents)
+        val_lbl.setObjectName("weightValue")
         row.addWidget(val_lbl)
         
-        return row, val_lbl
+        return row, slider, val_lbl
 
     def _create_header_label(self, text):
         """Card header label."""
         lbl = QLabel(text)
-        lbl.setStyleSheet("""
-            font-family: 'Segoe UI', sans-serif;
-            font-weight: bold;
-            font-size: 15px;
-            color: #f1f5f9;
-            padding-bottom: 8px;
-            border-bottom: 1px solid #1e293b;
-            margin-bottom: 8px;
-        """)
+        lbl.setObjectName("headerLabel")
         return lbl
 
-    def _group_style(self):
-        return """
-            QGroupBox {
-                border: 1px solid #1e293b;
-                border-radius: 12px;
-                background-color: #111827; /* Darker background */
-            }
-        """
-
-        # but title positioning matters.
-    
-    def _input_style(self) -> str:
-        return """
-            QSpinBox, QDoubleSpinBox {
-                background-color: #1f293b; 
-                color: #f8fafc;
-                border: 1px solid #334155;
-                border-radius: 6px;
-                padding: 0 10px;
-                font-size: 14px;
-                font-weight: 500;
-            }
-            QSpinBox:focus, QDoubleSpinBox:focus {
-                border: 1px solid #3b82f6;
-                background-color: #1e293b;
-            }
-            QSpinBox::up-button, QDoubleSpinBox::up-button,
-            QSpinBox::down-button, QDoubleSpinBox::down-button {
-                width: 0;
-                height: 0;
-            }
-        """
-    
-    def _slider_style(self, color) -> str:
-        return f"""
-            QSlider::groove:horizontal {{
-                border: none;
-                height: 4px;
-                background: #334155;
-                margin: 0;
-                border-radius: 2px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {color};
-                border: 2px solid #0f172a;
-                width: 16px;
-                height: 16px;
-                margin: -6px 0;
-                border-radius: 8px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {color};
-                border-radius: 2px;
-            }}
-        """
-    
-    def _button_style(self, color: str) -> str:
-        return f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-weight: 600;
-                font-size: 14px;
-                letter-spacing: 0.5px;
-            }}
-            QPushButton:hover {{
-                background-color: {color}dd;
-            }}
-            QPushButton:pressed {{
-                background-color: {color}aa;
-            }}
-            QPushButton:disabled {{
-                background-color: #334155;
-                color: #64748b;
-            }}
-        """
-        
-    def _algo_button_style(self) -> str:
-        return """
-            QPushButton {
-                background-color: transparent;
-                color: #94a3b8;
-                border: 1px solid #334155;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 500;
-                text-align: left;
-                padding-left: 8px;
-            }
-            QPushButton:hover {
-                border-color: #475569;
-                color: #e2e8f0;
-                background-color: #1e293b;
-            }
-            QPushButton:checked {
-                background-color: #a855f7;
-                border-color: #a855f7;
-                color: white;
-                font-weight: 600;
-            }
-        """
-
-
     def _on_weight_changed(self):
-        """Ağırlık değiştiğinde normalize et."""
-        delay = self.slider_delay.itemAt(1).widget().value()
-        rel = self.slider_rel.itemAt(1).widget().value()
-        res = self.slider_res.itemAt(1).widget().value()
+        """Ağırlık değişti; etiket güncellemesini zamanlayıcıyla birleştir."""
+        # Önbellek hemen düşer: zamanlayıcı dolmadan yapılan tıklama da
+        # güncel ağırlıkları almalı
+        self._cached_weights = None
+        # valueChanged(int) doğrudan start(int)'e bağlanırsa aralık değişir
+        self._weight_timer.start()
+
+    def _apply_weight_update(self):
+        """Ağırlık etiketlerini normalize edilmiş değerlerle güncelle."""
+        self._cached_weights = None
+        delay = self.slider_delay_w.value()
+        rel = self.slider_rel_w.value()
+        res = self.slider_res_w.value()
         
         total = delay + rel + res
         if total > 0:
-            self.label_delay.setText(f"{int(delay * 100 / total)}%")
-            self.label_rel.setText(f"{int(rel * 100 / total)}%")
-            self.label_res.setText(f"{int(res * 100 / total)}%")
+            pcts = (delay * 100 // total, rel * 100 // total, res * 100 // total)
+            if pcts == self._last_weight_pcts:
+                return
+            self._last_weight_pcts = pcts
+            d_pct, r_pct, res_pct = pcts
+            self.label_delay.setText(f"{d_pct}%")
+            self.label_rel.setText(f"{r_pct}%")
+            self.label_res.setText(f"{res_pct}%")
     
     def _on_prob_changed(self):
+        """Olasılık değişti; etiket güncellemesini zamanlayıcıyla birleştir."""
+        self._prob_timer.start()
+
+    def _apply_prob_label(self):
         val = self.slider_prob.value() / 100.0
         self.label_prob.setText(f"{val:.2f}")
 
     def _get_weights(self) -> Dict[str, float]:
-        """Normalize edilmiş ağırlıkları döndür."""
-        delay = self.slider_delay.itemAt(1).widget().value()
-        rel = self.slider_rel.itemAt(1).widget().value()
-        res = self.slider_res.itemAt(1).widget().value()
-        total = delay + rel + res
-        
-        if total == 0:
-            return {"delay": 0.33, "reliability": 0.33, "resource": 0.34}
-        
-        return {
-            "delay": delay / total,
-            "reliability": rel / total,
-            "resource": res / total
-        }
+        """
+        Normalize edilmiş ağırlıkları döndür.
+
+        Slider'lar değişene kadar aynı sözlük döner; alıcılar
+        değiştirmemelidir.
+        """
+        if self._cached_weights is None:
+            delay = self.slider_delay_w.value()
+            rel = self.slider_rel_w.value()
+            res = self.slider_res_w.value()
+            total = delay + rel + res
+            
+            if total == 0:
+                self._cached_weights = {"delay": 0.33, "reliability": 0.33, "resource": 0.34}
+            else:
+                self._cached_weights = {
+                    "delay": delay / total,
+                    "reliability": rel / total,
+                    "resource": res / total
+                }
+        return self._cached_weights
+    
+    def _on_algo_id_clicked(self, algo_id: int):
+        """Buton grubundan gelen tıklama: id'yi algoritma anahtarına çevir."""
+        self.selected_algo = self._ALGO_KEYS[algo_id]
     
     def _on_algo_selected(self, selected_key: str):
-        """Algoritma seçildiğinde diğerlerini kapat."""
+        """Algoritmayı programatik seç (diğerlerini exclusive grup kapatır)."""
         self.selected_algo = selected_key
-        for key, btn in self.algo_buttons.items():
-            if key != selected_key:
-                btn.setChecked(False)
-            else:
-                btn.setChecked(True)
+        self.algo_buttons[selected_key].setChecked(True)
     
     def _get_algorithm_key(self) -> str:
         """Seçili algoritma anahtarını döndür."""
@@ -714,6 +890,7 @@ class ControlPanel(QWidget):
     
     def _on_generate_clicked(self):
         """Graf oluştur butonuna tıklandı."""
+        self._ensure_optimization_group()
         # Slider is 1-90, representing 0.01-0.90
         prob = self.slider_prob.value() / 100.0
         self.generate_graph_requested.emit(
@@ -724,20 +901,11 @@ class ControlPanel(QWidget):
     
     def _on_optimize_clicked(self):
         """Optimize butonuna tıklandı."""
-        # Get demand if applicable
-        demand = 0.0
-        if self.combo_demands.isVisible():
-            idx = self.combo_demands.currentIndex()
-            if idx >= 0 and idx < len(self._demands):
-                # _demands is list of (src, dst, demand)
-                # Check if current source/dest match selected demand
-                # Even if they don't, if the user explicitly selected a demand, 
-                # we might want to respect it, or just use what's in the list.
-                # However, if user changes source manually, demand might not be relevant.
-                # Logic: If source/dest match the selected demand entry, use that demand.
-                d_src, d_dst, d_val = self._demands[idx]
-                if d_src == self.spin_source.value() and d_dst == self.spin_dest.value():
-                    demand = float(d_val)
+        # Kaynak/hedef yüklü taleplerden biriyse onun talebi kullanılır
+        # (combo seçiminden bağımsız; talep yoksa harita boştur)
+        demand = float(self._demand_map.get(
+            (self.spin_source.value(), self.spin_dest.value()), 0.0
+        ))
         
         # Seed: empty means random (None), otherwise parse the number
         seed_text = self.edit_algo_seed.text().strip()
@@ -765,12 +933,14 @@ class ControlPanel(QWidget):
     
     def set_node_range(self, max_node: int):
         """Düğüm ID aralığını ayarla."""
+        self._ensure_optimization_group()
         self.spin_source.setRange(0, max_node - 1)
         self.spin_dest.setRange(0, max_node - 1)
         self.spin_dest.setValue(max_node - 1)
     
     def set_loading(self, loading: bool):
         """Yükleniyor durumunu ayarla."""
+        self._ensure_optimization_group()
         self.btn_generate.setEnabled(not loading)
         if hasattr(self, 'btn_load_csv'):
             self.btn_load_csv.setEnabled(not loading)
@@ -780,17 +950,20 @@ class ControlPanel(QWidget):
             self.btn_reset.setEnabled(not loading)
         
         if loading:
-            self.progress_bar.setRange(0, 0)  # Indeterminate
-            self.progress_bar.show()
+            if not self.progress_bar.isVisible():
+                self._progress_timer.start()
         else:
+            self._progress_timer.stop()
             self.progress_bar.hide()
     
     def set_source(self, node: int):
         """Kaynak düğümü ayarla."""
+        self._ensure_optimization_group()
         self.spin_source.setValue(node)
     
     def set_destination(self, node: int):
         """Hedef düğümü ayarla."""
+        self._ensure_optimization_group()
         self.spin_dest.setValue(node)
     
     def set_demands(self, demands: List[Tuple[int, int, int]]):
@@ -800,31 +973,47 @@ class ControlPanel(QWidget):
         Args:
             demands: [(source, destination, demand_mbps), ...] listesi
         """
-        self._demands = demands
-        self.combo_demands.clear()
+        self._ensure_optimization_group()
+        # clear/addItem her adımda currentIndexChanged yayar; doldurma
+        # sırasında bastırılır, seçim aşağıda bir kez uygulanır
+        with QSignalBlocker(self.combo_demands):
+            # Aynı liste tekrar gelirse (ör. aynı CSV yeniden yüklenince)
+            # combo modeli yeniden kurulmaz; yalnızca ilk talep yeniden seçilir
+            key = tuple(demands)
+            if key != self._demands_key:
+                self._demands_key = key
+                self._demands = demands
+                self._demand_map = {(src, dst): demand for src, dst, demand in demands}
+                self.combo_demands.clear()
+                self.combo_demands.addItems([
+                    f"#{i}: {src} → {dst} ({demand} Mbps)"
+                    for i, (src, dst, demand) in enumerate(demands, 1)
+                ])
+            if demands:
+                self.combo_demands.setCurrentIndex(0)
         
         if demands:
-            for src, dst, demand in demands:
-                self.combo_demands.addItem(f"#{len(self.combo_demands) + 1}: {src} → {dst} ({demand} Mbps)")
-            
             # Talep seçiciyi göster
             self.label_demands.show()
             self.combo_demands.show()
             self.manual_separator.show()
             self.manual_label.show()
             
-            # İlk talebi seç
-            self.combo_demands.setCurrentIndex(0)
+            # İlk talebi seç (sinyal bastırıldığından slot doğrudan çağrılır)
+            self._on_demand_selected(0)
         else:
             self.hide_demands()
     
     def hide_demands(self):
         """Talep seçiciyi gizle."""
+        self._ensure_optimization_group()
         self.label_demands.hide()
         self.combo_demands.hide()
         self.manual_separator.hide()
         self.manual_label.hide()
         self._demands = []
+        self._demand_map = {}
+        self._demands_key = None
     
     def _on_load_csv_clicked(self):
         """CSV'den yükle butonuna tıklandı."""
@@ -840,10 +1029,25 @@ class ControlPanel(QWidget):
 
     def reset_defaults(self):
         """Tüm giriş alanlarını varsayılan değerlere sıfırla."""
-        # Graph generation defaults
+        self._ensure_optimization_group()
+        # Slider sinyalleri sıfırlama boyunca bastırılır; etiketler sonda
+        # bir kez güncellenir (setValue başına slot çağrısı yerine)
+        with QSignalBlocker(self.slider_prob), QSignalBlocker(self.slider_delay_w), \
+                QSignalBlocker(self.slider_rel_w), QSignalBlocker(self.slider_res_w):
+            # Graph generation defaults
+            self.slider_prob.setValue(40) # 0.40
+            
+            # Reset weights to ~33% each (Total 100)
+            self.slider_delay_w.setValue(33)
+            self.slider_rel_w.setValue(33)
+            self.slider_res_w.setValue(34)
+        
+        self._prob_timer.stop()
+        self._apply_prob_label()
+        self._weight_timer.stop()
+        self._apply_weight_update()
+        
         self.spin_nodes.setValue(250)
-        self.slider_prob.setValue(40) # 0.40
-        self._on_prob_changed() # Force label update
         self.spin_seed.setValue(42)
         
         # Optimization defaults
@@ -853,13 +1057,6 @@ class ControlPanel(QWidget):
         self.spin_source.setValue(0)
         self.spin_dest.setValue(249)
         
-        # Reset weights to ~33% each (Total 100)
-        self.slider_delay.itemAt(1).widget().setValue(33)
-        self.slider_rel.itemAt(1).widget().setValue(33)
-        self.slider_res.itemAt(1).widget().setValue(34)
-        # Force label update in case values didn't change but labels were wrong (unlikely but safe)
-        self._on_weight_changed()
-        
         # Algorithm defaults
         self._on_algo_selected("ga")  # Genetic
 
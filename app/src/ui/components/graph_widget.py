@@ -108,6 +108,7 @@ class GraphWidget(QWidget):
         
         # Broken edges tracking
         self.broken_edges: Set[Tuple[int, int]] = set()
+        self._broken_edge_data: Dict[Tuple[int, int], dict] = {}
         self.broken_edge_lines = []
         
         self._setup_ui()
@@ -361,6 +362,7 @@ class GraphWidget(QWidget):
         
         self.graph = graph
         self.broken_edges.clear()
+        self._broken_edge_data.clear()
         
         for line in self.broken_edge_lines:
             try:
@@ -528,8 +530,9 @@ class GraphWidget(QWidget):
         scale = np.array([10, 10, 10])
         edge_pts = []
         
+        broken_keys = self._broken_edge_keys()
         for u, v in self.graph.edges():
-            if (u, v) in self.broken_edges or (v, u) in self.broken_edges:
+            if broken_keys and ((u << 32) | v if u < v else (v << 32) | u) in broken_keys:
                 continue
             
             p1 = np.array(self.positions_3d[u]) * scale
@@ -727,8 +730,9 @@ class GraphWidget(QWidget):
         # Edges (non-broken)
         edge_x = []
         edge_y = []
+        broken_keys = self._broken_edge_keys()
         for u, v in self.graph.edges():
-            if (u, v) in self.broken_edges or (v, u) in self.broken_edges:
+            if broken_keys and ((u << 32) | v if u < v else (v << 32) | u) in broken_keys:
                 continue
             x1, y1 = self.positions[u]
             x2, y2 = self.positions[v]
@@ -1047,6 +1051,14 @@ class GraphWidget(QWidget):
     
 
 
+    def _broken_edge_keys(self) -> Set[int]:
+        """
+        Kırık kenarları yönsüz paketli int anahtar kümesine çevirir:
+        (min << 32) | max. Çizim döngüsünde kenar başına iki tuple
+        oluşturmak yerine tek int karşılaştırılır.
+        """
+        return {(u << 32) | v if u < v else (v << 32) | u for u, v in self.broken_edges}
+
     # =========== Kırılan linki graph widget'da göstermek için=====================0
     def _break_edge(self, u: int, v: int):
         if (u, v) in self.broken_edges or (v, u) in self.broken_edges:
@@ -1055,6 +1067,8 @@ class GraphWidget(QWidget):
         self.broken_edges.add((u, v))
         
         if self.graph.has_edge(u, v):
+            # Öznitelikler saklanır: geri eklenen kenar metriklerini korur
+            self._broken_edge_data[(u, v)] = dict(self.graph[u][v])
             self.graph.remove_edge(u, v)
         
         self._draw_broken_edge(u, v)
@@ -1277,6 +1291,7 @@ class GraphWidget(QWidget):
         self.current_hovered_edge = None
         
         self.broken_edges.clear()
+        self._broken_edge_data.clear()
         self.broken_edge_lines.clear()
         self.broken_edge_lines_3d = []
         
@@ -1294,9 +1309,10 @@ class GraphWidget(QWidget):
     def reset_broken_edges(self):
         for u, v in list(self.broken_edges):
             if not self.graph.has_edge(u, v):
-                self.graph.add_edge(u, v)
+                self.graph.add_edge(u, v, **self._broken_edge_data.get((u, v), {}))
         
         self.broken_edges.clear()
+        self._broken_edge_data.clear()
         
         for line in self.broken_edge_lines:
             try:
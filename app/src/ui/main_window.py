@@ -10,7 +10,7 @@ from PyQt5.QtWidgets import (
     QMessageBox, QStatusBar, QApplication, QTabWidget, QSplitter,
     QScrollArea, QFrame, QFileDialog, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from typing import Dict, List, Optional
 
 # __file__ = app/src/ui/main_window.py
@@ -134,6 +134,9 @@ class ComparisonWorker(QThread):
                 algo_items = ALGORITHMS
                 
             total = len(algo_items)
+
+            # Graf döngü boyunca değişmez: metrik dizileri bir kez kurulur
+            ms = MetricsService(self.graph)
             
             for i, (key, (name, AlgoClass)) in enumerate(algo_items.items()):
                 self.progress.emit(i + 1, total)
@@ -145,7 +148,6 @@ class ComparisonWorker(QThread):
                         weights=self.weights
                     )
                     
-                    ms = MetricsService(self.graph)
                     metrics = ms.calculate_all(
                         result.path,
                         self.weights['delay'],
@@ -913,6 +915,9 @@ class MainWindow(QMainWindow):
         if not self._check_graph():
             return
         
+        # Graf değişti: servisin türetilmiş önbelleklerini temizle
+        self.graph_service.invalidate_caches()
+        
         # Check if we have a current path and source/destination
         source = self.control_panel.spin_source.value()
         dest = self.control_panel.spin_dest.value()
@@ -943,18 +948,8 @@ class MainWindow(QMainWindow):
         weights = self.control_panel._get_weights()
         algorithm = self.control_panel._get_algorithm_key()
         
-        # Get demand if available (replicate logic from _on_optimize_clicked)
-        # We access private _demands here, assuming standard use
-        demand = 0.0
-        try:
-            if self.control_panel.combo_demands.isVisible():
-                idx = self.control_panel.combo_demands.currentIndex()
-                if idx >= 0:
-                     d_src, d_dst, d_val = self.control_panel._demands[idx]
-                     if d_src == source and d_dst == dest:
-                         demand = float(d_val)
-        except Exception:
-            pass # Fail safe
+        # Get demand if available (same lookup as _on_optimize_clicked)
+        demand = float(self.control_panel._demand_map.get((source, dest), 0.0))
         
         if algorithm and weights:
             self.status_bar.showMessage(f"🔴 Link {u}-{v} kırıldı! Yeni yol hesaplanıyor...", 3000)
@@ -1066,7 +1061,9 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            from src.services.report_service import get_report_service, ReportData, REPORTLAB_AVAILABLE
+            from src.services.report_service import (
+                ReportData, REPORTLAB_AVAILABLE, generate_pdf_report_async
+            )
             
             if not REPORTLAB_AVAILABLE:
                 QMessageBox.warning(
@@ -1078,7 +1075,6 @@ class MainWindow(QMainWindow):
             
             # Dosya kaydetme dialogu
             from PyQt5.QtWidgets import QFileDialog
-            import os
             
             default_name = f"QoS_Rapor_{result.algorithm.replace(' ', '_')}.pdf"
             filepath, _ = QFileDialog.getSaveFileName(
@@ -1119,16 +1115,12 @@ class MainWindow(QMainWindow):
                 edge_count=info.get('edge_count', 0)
             )
             
-            # PDF oluştur
-            service = get_report_service()
-            service.generate_pdf_report(report_data, filepath)
-            
-            # Geçici dosyayı temizle
-            if graph_image_path and os.path.exists(graph_image_path):
-                os.unlink(graph_image_path)
-            
-            self.status_bar.showMessage(f"PDF kaydedildi: {filepath}", 5000)
-            QMessageBox.information(self, "Başarılı", f"Rapor kaydedildi:\n{filepath}")
+            # PDF arka planda oluşturulur; geçici görüntü bitince silinir
+            self._watch_report(
+                generate_pdf_report_async(report_data, filepath),
+                filepath,
+                cleanup_path=graph_image_path
+            )
             
         except Exception as e:
             import traceback
@@ -1143,7 +1135,9 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            from src.services.report_service import get_report_service, REPORTLAB_AVAILABLE
+            from src.services.report_service import (
+                REPORTLAB_AVAILABLE, generate_comparison_report_async
+            )
             
             if not REPORTLAB_AVAILABLE:
                 QMessageBox.warning(
@@ -1180,14 +1174,49 @@ class MainWindow(QMainWindow):
             source = self.control_panel.spin_source.value()
             dest = self.control_panel.spin_dest.value()
             
-            # PDF oluştur
-            service = get_report_service()
-            service.generate_comparison_report(results_data, filepath, source, dest, weights)
-            
-            self.status_bar.showMessage(f"PDF kaydedildi: {filepath}", 5000)
-            QMessageBox.information(self, "Başarılı", f"Rapor kaydedildi:\n{filepath}")
+            # PDF arka planda oluşturulur
+            self._watch_report(
+                generate_comparison_report_async(results_data, filepath, source, dest, weights),
+                filepath
+            )
             
         except Exception as e:
             import traceback
             QMessageBox.critical(self, "Hata", f"PDF oluşturma hatası:\n{str(e)}")
             traceback.print_exc()
+    
+    def _watch_report(self, future, filepath: str, cleanup_path: Optional[str] = None):
+        """
+        Arka plandaki PDF üretimini olay döngüsünü bloklamadan izler.
+
+        Future, QTimer ile 100 ms'de bir yoklanır; bitince geçici dosya
+        silinir ve sonuç (başarı veya hata) kullanıcıya bildirilir.
+        """
+        self.status_bar.showMessage("PDF oluşturuluyor...")
+        timer = QTimer(self)
+        timer.setInterval(100)
+        
+        def poll():
+            if not future.done():
+                return
+            timer.stop()
+            timer.deleteLater()
+            
+            # Geçici dosyayı temizle
+            if cleanup_path and os.path.exists(cleanup_path):
+                os.unlink(cleanup_path)
+            
+            try:
+                future.result()
+            except Exception as e:
+                import traceback
+                self.status_bar.clearMessage()
+                QMessageBox.critical(self, "Hata", f"PDF oluşturma hatası:\n{str(e)}")
+                traceback.print_exception(type(e), e, e.__traceback__)
+                return
+            
+            self.status_bar.showMessage(f"PDF kaydedildi: {filepath}", 5000)
+            QMessageBox.information(self, "Başarılı", f"Rapor kaydedildi:\n{filepath}")
+        
+        timer.timeout.connect(poll)
+        timer.start()
@@ -25,12 +25,20 @@ SİNYAL-SLOT MEKANİZMASI:
 
 from PyQt5.QtCore import QThread, pyqtSignal
 from typing import Dict, Any, Optional
+import time
 import networkx as nx
 
 from src.services.metrics_service import MetricsService
 from src.ui.components.results_panel import OptimizationResult
 
 
+# İki progress_data yayını arasındaki en kısa süre (~25 Hz). Hızlı algoritmalar
+# bir olay döngüsü turunda onlarca iterasyon bildirebilir; canlı grafik bu
+# hızdan fazlasını gösteremez. Aradaki örneklerin en sonuncusu bekletilir ve
+# aralık dolunca (ya da optimizasyon bitince) iletilir.
+PROGRESS_EMIT_INTERVAL_S = 0.04
+
+
 class OptimizationWorker(QThread):
     """
     Genel Amaçlı Optimizasyon Worker'ı
@@ -56,7 +64,8 @@ class OptimizationWorker(QThread):
     SİNYALLER (Signals):
     --------------------
     finished(OptimizationResult): Optimizasyon tamamlandığında emit edilir
-    progress_data(int, float): Her iterasyonda (iterasyon_no, fitness) emit edilir
+    progress_data(int, float): En fazla ~25 Hz ile (iterasyon_no, fitness) emit edilir;
+        son örnek her zaman iletilir
     error(str): Hata durumunda hata mesajı emit edilir
     """
     
@@ -129,6 +138,14 @@ class OptimizationWorker(QThread):
             #
             # Örnek: GA her nesilde, ACO her iterasyonda bunu çağırır.
             #
+            # Yayınlar PROGRESS_EMIT_INTERVAL_S ile seyreltilir: her sinyal
+            # ana thread'e bir kuyruk olayı ve bir slot çağrısı demektir.
+            # Aradaki örneklerden yalnızca en sonuncusu bekletilir; aralık
+            # dolunca o, optimize() bitince de kalan son örnek iletilir.
+            #
+            last_emit = [float('-inf')]
+            pending = [None]  # Henüz iletilmemiş son (iterasyon, fitness)
+            
             def on_progress(iteration: int, fitness: float):
                 """
                 İlerleme verisini UI'a ilet.
@@ -137,6 +154,12 @@ class OptimizationWorker(QThread):
                     iteration: Mevcut iterasyon/nesil numarası
                     fitness: Bu iterasyondaki en iyi fitness değeri
                 """
+                pending[0] = (iteration, fitness)
+                now = time.perf_counter()
+                if now - last_emit[0] < PROGRESS_EMIT_INTERVAL_S:
+                    return
+                last_emit[0] = now
+                pending[0] = None
                 # progress_data sinyali emit et → ConvergenceWidget güncellenir
                 self.progress_data.emit(iteration, fitness)
             
@@ -147,15 +170,22 @@ class OptimizationWorker(QThread):
             # result = algorithm.optimize(source, destination, weights, ...)
             #
             # progress_callback parametresi sayesinde canlı grafik çizilir.
+            # progress_data'ya bağlı bir slot yoksa (grafik gösterilmiyorsa)
+            # callback hiç verilmez; algoritmalar ilerleme hesabını atlar.
             #
+            has_listener = self.receivers(self.progress_data) > 0
             result = self.algorithm_instance.optimize(
                 source=self.source,
                 destination=self.dest,
                 weights=self.weights,
                 bandwidth_demand=self.bandwidth_demand,
-                progress_callback=on_progress  # Canlı grafik için callback
+                progress_callback=on_progress if has_listener else None  # Canlı grafik için callback
             )
             
+            # Seyreltme yüzünden bekleyen son örnek (genelde yakınsanmış değer)
+            if pending[0] is not None:
+                self.progress_data.emit(*pending[0])
+            
             # ==============================================================
             # ADIM 3: Metrikleri Hesapla
             # ==============================================================
@@ -184,8 +214,10 @@ class OptimizationWorker(QThread):
             # Bu SERT KISIT (hard constraint) yaklaşımıdır - ya karşılanır
             # ya da çözüm reddedilir.
             #
+            # (PathMetrics önbellekten paylaşılabilir; yerinde değiştirilmez)
+            weighted_cost = metrics.weighted_cost
             if self.bandwidth_demand > 0 and metrics.min_bandwidth < self.bandwidth_demand:
-                metrics.weighted_cost = float('inf')  # Geçersiz çözüm
+                weighted_cost = float('inf')  # Geçersiz çözüm
             
             # ==============================================================
             # ADIM 5: Sonuç Nesnesini Oluştur
@@ -199,7 +231,7 @@ class OptimizationWorker(QThread):
                 total_delay=metrics.total_delay,     # 45.2 ms
                 total_reliability=metrics.total_reliability,  # 0.0823 (log-cost)
                 resource_cost=metrics.resource_cost,  # 2.34
-                weighted_cost=metrics.weighted_cost,  # 0.234 (final score)
+                weighted_cost=weighted_cost,          # 0.234 (final score)
                 computation_time_ms=result.computation_time_ms,  # 150.5 ms
                 min_bandwidth=metrics.min_bandwidth,  # 450 Mbps
                 seed_used=getattr(result, 'seed_used', None)  # Tekrarlanabilirlik için